@@ -0,0 +1,73 @@
+"""Shared pytest fixtures for the video-kb-simple test suite."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+# The CLI imports the downloader (and with it yt_dlp, ~0.1s) lazily; importing it here makes the
+# heavy import happen once per session/xdist worker, before test modules are collected
+import video_kb_simple.downloader  # noqa: F401
+from video_kb_simple.cli import app
+from video_kb_simple.models import PlaylistDetails, PlaylistResult, PlaylistType
+
+
+@pytest.fixture
+def playlist_details() -> PlaylistDetails:
+    """Details of a one-video playlist, as extracted by yt-dlp or read back from the cache."""
+    return PlaylistDetails(
+        playlist_id="test",
+        playlist_type=PlaylistType.PLAYLIST,
+        title="Test Playlist",
+        url="https://www.youtube.com/playlist?list=test",
+        video_urls=["https://www.youtube.com/watch?v=dQw4w9WgXcQ"],
+    )
+
+
+@pytest.fixture
+def sample_playlist_result() -> PlaylistResult:
+    """A single-video PlaylistResult with no downloads, as returned for a simple run."""
+    return PlaylistResult(
+        playlist_details=PlaylistDetails(
+            playlist_id="test",
+            playlist_type=PlaylistType.SINGLE_VIDEO,
+            title="Test Video",
+            url="https://www.youtube.com/watch?v=test",
+            video_urls=["https://www.youtube.com/watch?v=test"],
+        ),
+        video_results=[],
+        total_requested=1,
+        processing_time_seconds=1.5,
+    )
+
+
+@pytest.fixture
+def mock_downloader(sample_playlist_result: PlaylistResult) -> Iterator[MagicMock]:
+    """Patch the SimpleDownloader class used by the CLI so no real downloads happen.
+
+    The mocked instance returns sample_playlist_result from download_transcripts.
+    """
+    with patch("video_kb_simple.downloader.SimpleDownloader") as mock_downloader_class:
+        mock_downloader_class.return_value.download_transcripts.return_value = (
+            sample_playlist_result
+        )
+        yield mock_downloader_class
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """A CliRunner shared by the whole session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_output(cli_runner: CliRunner):
+    """Result of `video-kb --help`, rendered once per session."""
+    return cli_runner.invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def version_output(cli_runner: CliRunner):
+    """Result of `video-kb --version`, rendered once per session."""
+    return cli_runner.invoke(app, ["--version"])
@@ -1,18 +1,22 @@
 """Tests for the ANSI converter module."""
 
+from io import StringIO
+
 import pytest
+from rich.console import Console
 
 from video_kb_simple.ansi_converter import ANSIConverter, ansi_to_rich
 
 
+@pytest.fixture(scope="module")
+def converter():
+    """Create one ANSIConverter instance shared by the module (it holds no per-call state)."""
+    return ANSIConverter()
+
+
 class TestANSIConverter:
     """Test the ANSIConverter class."""
 
-    @pytest.fixture
-    def converter(self):
-        """Create a fresh ANSIConverter instance for each test."""
-        return ANSIConverter()
-
     def test_basic_colors(self, converter):
         """Test basic ANSI foreground color conversion."""
         # Red
@@ -73,6 +77,19 @@ class TestANSIConverter:
         text = "Plain text without colors"
         assert converter.convert(text) == text
 
+    def test_no_ansi_sequences_escapes_brackets(self, converter):
+        """Test that plain text still gets literal brackets escaped."""
+        assert converter.convert("Plain [bold]text") == "Plain \\[bold]text"
+
+    def test_brackets_escaped_around_sequences(self, converter):
+        """Test that literal brackets and backslashes next to ANSI codes stay literal."""
+        text = "\033[33m[download]\033[0m 50% [x]"
+        assert converter.convert(text) == "[yellow]\\[download][/] 50% \\[x]"
+        # A backslash before a sequence must not escape the generated tag
+        assert converter.convert("C:\\\033[32mdir\033[0m") == "C:\\\\[green]dir[/]"
+        # Text split by a sequence that emits no markup is escaped as one run
+        assert converter.convert("[b\033[0mold]") == "\\[bold]"
+
     def test_empty_string(self, converter):
         """Test empty string handling."""
         assert converter.convert("") == ""
@@ -83,6 +100,12 @@ class TestANSIConverter:
         text = "[32mNot ANSI[0m"
         assert converter.convert(text) == text  # Should remain unchanged
 
+    def test_non_sgr_sequences_only(self, converter):
+        """Test text with escape sequences that are not colors or styles."""
+        # yt-dlp progress lines start with a carriage return and an erase-line sequence
+        text = "\r\033[K[download]  50.0%"
+        assert converter.convert(text) == "\r\033[K\\[download]  50.0%"
+
     def test_256_color_codes(self, converter):
         """Test 256-color ANSI codes."""
         # 256-color foreground
@@ -114,6 +137,37 @@ class TestANSIConverter:
         assert "[green]Green[/]" in result
         assert "[blue]Blue[/]" in result
 
+    def test_repeated_and_long_inputs(self, converter):
+        """Test that cached short inputs and uncached long inputs convert the same way."""
+        short_text = "\033[0;32m[download]\033[0m"
+        assert converter.convert(short_text) == converter.convert(short_text)
+        assert converter.convert(short_text) == "[green]\\[download][/]"
+
+        long_text = "\033[32m" + "x" * 300 + "\033[0m"
+        assert converter.convert(long_text) == "[green]" + "x" * 300 + "[/]"
+
+
+class TestANSIStrip:
+    """Test stripping ANSI sequences to plain text."""
+
+    def test_strip_colors(self, converter):
+        """Test that color and style sequences are removed."""
+        text = "Downloading item \033[0;32m69\033[0m of \033[1;94m180\033[0m"
+        assert converter.strip_ansi(text) == "Downloading item 69 of 180"
+
+    def test_strip_keeps_brackets(self, converter):
+        """Test that literal brackets are not escaped in plain output."""
+        assert converter.strip_ansi("\033[33m[download]\033[0m 50%") == "[download] 50%"
+
+    def test_strip_no_ansi(self, converter):
+        """Test that text without ANSI sequences is returned unchanged."""
+        assert converter.strip_ansi("Plain [text]") == "Plain [text]"
+        assert converter.strip_ansi("") == ""
+
+    def test_strip_keeps_non_sgr_sequences(self, converter):
+        """Test that incomplete or non-color sequences are left in place."""
+        assert converter.strip_ansi("\033[2KDone\033[") == "\033[2KDone\033["
+
 
 class TestANSIToRichFunction:
     """Test the ansi_to_rich convenience function."""
@@ -146,10 +200,6 @@ class TestANSIRichIntegration:
 
     def test_rich_rendering(self):
         """Test that converted ANSI renders correctly with Rich."""
-        from io import StringIO
-
-        from rich.console import Console
-
         output_buffer = StringIO()
         console = Console(file=output_buffer, width=80)
 
@@ -166,10 +216,6 @@ class TestANSIRichIntegration:
 
     def test_embedded_markup(self):
         """Test that converted ANSI can be embedded in other Rich markup."""
-        from io import StringIO
-
-        from rich.console import Console
-
         output_buffer = StringIO()
         console = Console(file=output_buffer, width=80)
 
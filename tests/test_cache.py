@@ -0,0 +1,32 @@
+"""Tests for the cache module."""
+
+from video_kb_simple.cache import PlaylistCache
+from video_kb_simple.models import PlaylistType
+
+
+class TestPlaylistCache:
+    """Test the on-disk playlist details cache."""
+
+    def test_round_trip(self, tmp_path, playlist_details):
+        """Test that stored details are returned for the same URL and type only."""
+        url = playlist_details.url
+        cache = PlaylistCache(tmp_path / "cache")
+        assert cache.get(url, PlaylistType.PLAYLIST) is None
+
+        cache.set(url, PlaylistType.PLAYLIST, playlist_details)
+
+        assert cache.get(url, PlaylistType.PLAYLIST) == playlist_details
+        assert cache.get(url, PlaylistType.CHANNEL_VIDEOS) is None
+        assert cache.clear() == 1
+        assert cache.get(url, PlaylistType.PLAYLIST) is None
+
+    def test_expired_and_corrupt_entries_are_misses(self, tmp_path, playlist_details):
+        """Test that stale or unreadable entries are ignored instead of raising."""
+        url = playlist_details.url
+        cache = PlaylistCache(tmp_path, ttl_seconds=-1)
+        cache.set(url, PlaylistType.PLAYLIST, playlist_details)
+        assert cache.get(url, PlaylistType.PLAYLIST) is None
+
+        cache.ttl_seconds = 3600
+        next(tmp_path.glob("*.json.gz")).write_bytes(b"not gzip")
+        assert cache.get(url, PlaylistType.PLAYLIST) is None
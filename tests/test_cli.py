@@ -1,188 +1,296 @@
 """Tests for the CLI module."""
 
-import os
+import json
+import logging
+import re
 import signal
 import subprocess
 import sys
-import time
-from pathlib import Path
-from unittest.mock import patch
+from io import StringIO
+from unittest.mock import ANY, patch
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 from video_kb_simple import __version__
-from video_kb_simple.cli import _display_batch_results, _display_items, app
+from video_kb_simple.cli import (
+    _display_batch_results,
+    _display_items,
+    _parse_languages,
+    app,
+    create_signal_handler,
+    download,
+)
 from video_kb_simple.models import (
+    DownloadedFile,
     PlaylistDetails,
     PlaylistResult,
     PlaylistType,
+    VideoResult,
 )
+from video_kb_simple.utils import DEFAULT_CACHE_DIR
 
 runner = CliRunner()
 
 
-def test_version_callback():
+def test_version_callback(version_output):
     """Test --version flag functionality."""
-    result = runner.invoke(app, ["--version"])
-    assert result.exit_code == 0
-    assert f"video-kb-simple version: {__version__}" in result.stdout
+    assert version_output.exit_code == 0
+    assert f"video-kb-simple version: {__version__}" in version_output.stdout
 
 
-def test_main_help():
+def test_main_help(help_output):
     """Test main help command output."""
-    result = runner.invoke(app, ["--help"])
-    assert result.exit_code == 0
-    assert "Extract transcribed text from videos using yt-dlp" in result.stdout
-    assert "download" in result.stdout
+    assert help_output.exit_code == 0
+    assert "Extract transcribed text from videos using yt-dlp" in help_output.stdout
+    assert "download" in help_output.stdout
+
+
+def test_cli_import_does_not_load_downloader():
+    """Test that importing the CLI (e.g. for --version) leaves yt-dlp and pydantic unloaded."""
+    check = (
+        "import sys, video_kb_simple.cli; "
+        "print(sorted({'yt_dlp', 'pydantic'} & sys.modules.keys()))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "[]"
 
 
 def test_double_ctrl_c_forces_exit():
     """Test that double Ctrl+C forces immediate exit."""
-    # Mock the downloader to simulate a long-running operation
-    with patch("video_kb_simple.cli.SimpleDownloader") as mock_downloader:
-        mock_instance = mock_downloader.return_value
-
-        # Create a mock result to prevent early exit
-        from video_kb_simple.models import PlaylistDetails, PlaylistResult, PlaylistType
-
-        mock_result = PlaylistResult(
-            playlist_details=PlaylistDetails(
-                playlist_id="test",
-                playlist_type=PlaylistType.SINGLE_VIDEO,
-                title="Test Video",
-                url="https://www.youtube.com/watch?v=test",
-                video_urls=["https://www.youtube.com/watch?v=test"],
-            ),
-            video_results=[],
-            total_requested=1,
-            processing_time_seconds=0.0,
-        )
-        mock_instance.download_transcripts.return_value = mock_result
+    output = StringIO()
+    console = Console(file=output, width=80)
+    original_handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+    try:
+        is_shutdown_requested = create_signal_handler(console)
+        handler = signal.getsignal(signal.SIGINT)
+        assert callable(handler)
+
+        # First SIGINT requests a graceful shutdown
+        handler(signal.SIGINT, None)
+        assert is_shutdown_requested()
+        assert "Shutdown requested" in output.getvalue()
+
+        # Second SIGINT forces immediate exit, without interpreter shutdown
+        with (
+            patch("video_kb_simple.cli.os._exit") as mock_exit,
+            patch.object(console, "show_cursor") as mock_show_cursor,
+        ):
+            handler(signal.SIGINT, None)
+    finally:
+        for sig, original_handler in original_handlers.items():
+            signal.signal(sig, original_handler)
+
+    mock_exit.assert_called_once_with(1)
+    mock_show_cursor.assert_called_once_with(True)
+    assert "Force exiting immediately" in output.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "expected_fragment", "exit_code"),
+    [
+        (None, "Download Summary", 0),
+        (Exception("Invalid URL"), "Error: Invalid URL", 1),
+        (Exception("Network timeout"), "Error: Network timeout", 1),
+        (PermissionError("Permission denied"), "Error: Permission denied", 1),
+    ],
+    ids=["success", "invalid-url", "network-error", "permission-error"],
+)
+def test_download_flow(mock_downloader, side_effect, expected_fragment, exit_code):
+    """Test download command outcome and output for success and error paths."""
+    mock_downloader.return_value.download_transcripts.side_effect = side_effect
+
+    result = runner.invoke(app, ["download", "https://www.youtube.com/watch?v=test"])
+    assert result.exit_code == exit_code
+    assert expected_fragment in result.stdout
+    mock_downloader.assert_called_once()
+
 
-        # Start the CLI in a subprocess with a valid YouTube URL format
-        cmd = [
-            sys.executable,
-            "-m",
-            "video_kb_simple",
+@pytest.mark.usefixtures("mock_downloader")
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_download_machine_readable_output(sample_playlist_result, tmp_path, output_format):
+    """Test that --format json/ndjson prints only JSON on stdout, without Rich rendering."""
+    sample_playlist_result.video_results = [VideoResult(video_id="test", title="Test Video")]
+
+    result = runner.invoke(
+        app,
+        [
             "download",
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-        ]
-
-        proc = subprocess.Popen(
-            cmd,
-            cwd=Path(__file__).parent.parent,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            preexec_fn=os.setsid if hasattr(os, "setsid") else None,
-        )
+            "https://www.youtube.com/watch?v=test",
+            "--output",
+            str(tmp_path),
+            "--format",
+            output_format,
+            "--lang",
+            "en,es",
+            "--max-languages",
+            "1",
+            "--verbose",
+        ],
+    )
 
-        try:
-            # Wait for process to start and set up signal handlers
-            time.sleep(0.5)
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 1
+    payload = json.loads(lines[0])
+    if output_format == "json":
+        payload = payload["video_results"][0]
+    assert payload["video_id"] == "test"
+    assert "Downloading transcripts from:" in result.stderr
+    assert "Only the first 1 of 2 languages" in result.stderr
+
+
+def test_download_ndjson_streams_only_finished_videos(
+    mock_downloader, sample_playlist_result, tmp_path
+):
+    """Test that the video-count progress report is not streamed as an NDJSON line."""
+    video_result = VideoResult(video_id="test", title="Test Video")
+    sample_playlist_result.video_results = [video_result]
+
+    def fake_download_transcripts(**_kwargs):
+        progress_callback = mock_downloader.call_args.kwargs["progress_callback"]
+        progress_callback(0, 1, None)
+        progress_callback(1, 1, video_result)
+        return sample_playlist_result
+
+    mock_downloader.return_value.download_transcripts.side_effect = fake_download_transcripts
+
+    result = runner.invoke(
+        app,
+        [
+            "download",
+            "https://www.youtube.com/watch?v=test",
+            "-o",
+            str(tmp_path),
+            "--format",
+            "ndjson",
+        ],
+    )
 
-            # Send first SIGINT
-            proc.send_signal(signal.SIGINT)
-            time.sleep(0.1)
+    assert result.exit_code == 0
+    assert [json.loads(line)["video_id"] for line in result.stdout.splitlines()] == ["test"]
 
-            # Send second SIGINT
-            proc.send_signal(signal.SIGINT)
 
-            # Wait for process to exit with timeout
-            try:
-                stdout, stderr = proc.communicate(timeout=2)
-                combined_output = stdout + stderr
+def test_download_command_with_options(mock_downloader, tmp_path):
+    """Test download command with various options."""
+    mock_downloader.return_value.download_transcripts.return_value = PlaylistResult(
+        playlist_details=None,
+        video_results=[],
+        total_requested=1,
+        processing_time_seconds=1.0,
+    )
 
-                # Verify the process exited (should have non-zero exit code from exit(1))
-                assert proc.returncode == 1, f"Expected exit code 1, got {proc.returncode}"
+    result = runner.invoke(
+        app,
+        [
+            "download",
+            "https://www.youtube.com/watch?v=test",
+            "--output",
+            str(tmp_path),
+            "--force",
+            "--lang",
+            "en,es",
+            "--max-videos",
+            "5",
+            "--verbose",
+        ],
+    )
+    assert result.exit_code == 0
 
-                # Verify we see the force exit message
-                assert "Force exiting immediately" in combined_output, (
-                    f"Force exit message not found in output: {combined_output}"
-                )
 
-            except subprocess.TimeoutExpired:
-                proc.kill()
-                pytest.fail("Process did not exit within timeout after double Ctrl+C")
-
-        finally:
-            # Clean up process if still running
-            if proc.poll() is None:
-                proc.kill()
-                proc.wait()
-
-
-def test_download_command_basic():
-    """Test basic download command execution."""
-    with patch("video_kb_simple.cli.SimpleDownloader") as mock_downloader:
-        mock_instance = mock_downloader.return_value
-        mock_result = PlaylistResult(
-            playlist_details=PlaylistDetails(
-                playlist_id="test",
-                playlist_type=PlaylistType.SINGLE_VIDEO,
-                title="Test Video",
-                url="https://www.youtube.com/watch?v=test",
-                video_urls=["https://www.youtube.com/watch?v=test"],
-            ),
-            video_results=[],
-            total_requested=1,
-            processing_time_seconds=1.5,
+def test_download_passes_options_to_downloader(mock_downloader, tmp_path):
+    """Test that download options reach SimpleDownloader without going through CliRunner."""
+    with patch("video_kb_simple.cli.create_signal_handler") as mock_signal_handler:
+        download(
+            url="https://www.youtube.com/watch?v=test",
+            output_dir=tmp_path,
+            force_download=True,
+            browser_cookies="firefox",
+            languages=["en,es", "en"],
+            max_videos=5,
+            concurrency=4,
+            cache_dir=tmp_path / "cache",
+            cache_ttl=60,
+            refresh_cache=True,
         )
-        mock_instance.download_transcripts.return_value = mock_result
 
-        result = runner.invoke(app, ["download", "https://www.youtube.com/watch?v=test"])
-        assert result.exit_code == 0
-        mock_downloader.assert_called_once()
+    mock_downloader.assert_called_once_with(
+        output_dir=tmp_path,
+        log_level=logging.WARNING,
+        force_download=True,
+        browser_for_cookies="firefox",
+        shutdown_check=mock_signal_handler.return_value,
+        concurrency=4,
+        cache_dir=tmp_path / "cache",
+        cache_ttl=60,
+        progress_callback=ANY,
+        refresh_cache=True,
+        ytdlp_cache_dir=tmp_path / "cache",
+    )
+    mock_downloader.return_value.download_transcripts.assert_called_once_with(
+        url="https://www.youtube.com/watch?v=test",
+        max_videos=5,
+        subtitle_languages=["en", "es"],
+    )
 
 
-def test_download_command_with_options():
-    """Test download command with various options."""
-    with patch("video_kb_simple.cli.SimpleDownloader") as mock_downloader:
-        mock_instance = mock_downloader.return_value
-        mock_result = PlaylistResult(
-            playlist_details=None,
-            video_results=[],
-            total_requested=1,
-            processing_time_seconds=1.0,
-        )
-        mock_instance.download_transcripts.return_value = mock_result
-
-        result = runner.invoke(
-            app,
-            [
-                "download",
-                "https://www.youtube.com/watch?v=test",
-                "--output",
-                "/tmp/test",
-                "--force",
-                "--lang",
-                "en,es",
-                "--max-videos",
-                "5",
-                "--verbose",
-            ],
+@pytest.mark.parametrize(
+    ("languages", "max_languages", "expected"),
+    [
+        (None, None, ["en"]),
+        (["en, ,es,", "es"], None, ["en", "es"]),
+        ([" , "], None, ["en"]),
+        ([",".join(f"l{i}" for i in range(12))], None, [f"l{i}" for i in range(12)]),
+        ([",".join(f"l{i}" for i in range(12))], 3, ["l0", "l1", "l2"]),
+    ],
+    ids=["default", "empty-entries", "only-empty", "uncapped", "capped"],
+)
+def test_download_language_parsing(mock_downloader, tmp_path, languages, max_languages, expected):
+    """Test --lang parsing: empty entries dropped, default fallback and --max-languages."""
+    with patch("video_kb_simple.cli.create_signal_handler"):
+        download(
+            url="https://www.youtube.com/watch?v=test",
+            output_dir=tmp_path,
+            languages=languages,
+            max_languages=max_languages,
         )
-        assert result.exit_code == 0
 
+    download_kwargs = mock_downloader.return_value.download_transcripts.call_args.kwargs
+    assert download_kwargs["subtitle_languages"] == expected
 
-def test_download_command_error_handling():
-    """Test download command error handling."""
-    with patch("video_kb_simple.cli.SimpleDownloader") as mock_downloader:
-        mock_instance = mock_downloader.return_value
-        mock_instance.download_transcripts.side_effect = Exception("Test error")
 
-        result = runner.invoke(app, ["download", "https://www.youtube.com/watch?v=test"])
-        assert result.exit_code == 1
-        assert "Test error" in result.stdout
+def test_download_keeps_ytdlp_cache_dir_by_default(mock_downloader, tmp_path):
+    """Test that without --cache-dir the playlist cache uses its default and yt-dlp keeps its own."""
+    with patch("video_kb_simple.cli.create_signal_handler"):
+        download(url="https://www.youtube.com/watch?v=test", output_dir=tmp_path)
 
+    downloader_kwargs = mock_downloader.call_args.kwargs
+    assert downloader_kwargs["cache_dir"] == DEFAULT_CACHE_DIR
+    assert downloader_kwargs["ytdlp_cache_dir"] is None
 
-def test_display_items_empty():
-    """Test _display_items with empty list."""
-    from io import StringIO
 
-    from rich.console import Console
+def test_parse_languages_keeps_case_and_order():
+    """Test that language codes keep their case (yt-dlp matches them case-sensitively)."""
+    assert _parse_languages(["zh-Hans", " pt-BR ,zh-Hans", "en"]) == ["zh-Hans", "pt-BR", "en"]
 
+
+def test_cache_clear_command(tmp_path):
+    """Test that `cache clear` removes cached playlist entries."""
+    (tmp_path / "entry.json.gz").write_bytes(b"")
+
+    result = runner.invoke(app, ["cache", "clear", "--cache-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Removed 1 cached playlist entries" in result.stdout
+    assert not list(tmp_path.iterdir())
+
+
+def test_display_items_empty():
+    """Test _display_items with empty list."""
     console = Console(file=StringIO(), width=80)
     _display_items([], "Warnings", console)
     # Should not print anything for empty list
@@ -190,10 +298,6 @@ def test_display_items_empty():
 
 def test_display_items_with_content():
     """Test _display_items with content."""
-    from io import StringIO
-
-    from rich.console import Console
-
     output = StringIO()
     console = Console(file=output, width=80)
     _display_items(["Warning 1", "Warning 2"], "Warnings", console, "yellow")
@@ -206,10 +310,6 @@ def test_display_items_with_content():
 
 def test_display_batch_results():
     """Test _display_batch_results function."""
-    from io import StringIO
-
-    from rich.console import Console
-
     # Create mock data
     mock_result = PlaylistResult(
         playlist_details=PlaylistDetails(
@@ -229,6 +329,103 @@ def test_display_batch_results():
     _display_batch_results(mock_result, console)
 
     content = output.getvalue()
-    assert "Download Summary" in content
-    assert "Test Video" in content
-    assert "2.5s" in content
+    expected_fragments = {
+        "Download Summary",
+        "Test Video",
+        "single_video",
+        "Total videos requested",
+        "Processing time",
+        "2.5s",
+    }
+    missing = {fragment for fragment in expected_fragments if fragment not in content}
+    assert not missing, f"Missing from summary output: {missing}"
+
+
+def test_display_batch_results_compact(sample_playlist_result, tmp_path):
+    """Test that a single error-free video gets a one-line summary instead of the table."""
+    subtitle_path = tmp_path / "test.en.vtt"
+    sample_playlist_result.video_results = [
+        VideoResult(
+            video_id="test",
+            title="Test Video",
+            url="https://www.youtube.com/watch?v=test",
+            warnings=["Some subtitles missing"],
+            downloaded_files=[
+                DownloadedFile(path=subtitle_path, file_type="subtitle", language="en")
+            ],
+        )
+    ]
+
+    output = StringIO()
+    console = Console(file=output, width=200)
+    _display_batch_results(sample_playlist_result, console, compact=True)
+
+    content = output.getvalue()
+    assert "Download Summary: Test Video - 1 files to" in content
+    assert str(tmp_path) in content
+    assert "Warnings (1)" in content
+    assert "Total videos requested" not in content
+
+    # Errors always get the full table
+    sample_playlist_result.video_results[0].errors = ["Download failed"]
+    _display_batch_results(sample_playlist_result, console, compact=True)
+    assert "Total videos requested" in output.getvalue()
+
+
+def test_display_batch_results_compact_keeps_table_for_playlists(sample_playlist_result):
+    """Test that a playlist with a single finished video still gets the full table."""
+    sample_playlist_result.playlist_details = PlaylistDetails(
+        playlist_id="PLtest",
+        playlist_type=PlaylistType.PLAYLIST,
+        title="Test Playlist",
+        url="https://www.youtube.com/playlist?list=PLtest",
+        video_urls=[f"https://www.youtube.com/watch?v=test{i}" for i in range(3)],
+    )
+    sample_playlist_result.video_results = [VideoResult(video_id="test0", title="Test Video")]
+
+    output = StringIO()
+    console = Console(file=output, width=200)
+    _display_batch_results(sample_playlist_result, console, compact=True)
+
+    content = output.getvalue()
+    assert "Total videos requested" in content
+    assert "Download Summary:" not in content
+
+
+@pytest.mark.parametrize(
+    ("file_count", "expected_names", "summary"),
+    [
+        (2, ["video0.en.vtt", "video1.en.vtt"], None),
+        (12, ["video0.en.vtt", "video2.en.vtt"], "... and 9 more files"),
+    ],
+    ids=["all-files", "truncated"],
+)
+def test_display_batch_results_file_listing(
+    sample_playlist_result, tmp_path, file_count, expected_names, summary
+):
+    """Test that downloaded files are listed individually or truncated with a summary."""
+    sample_playlist_result.video_results = [
+        VideoResult(
+            video_id="test",
+            title="Test Video",
+            downloaded_files=[
+                DownloadedFile(
+                    path=tmp_path / f"video{i}.en.vtt", file_type="subtitle", language="en"
+                )
+                for i in range(file_count)
+            ],
+        )
+    ]
+
+    output = StringIO()
+    console = Console(file=output, width=200)
+    _display_batch_results(sample_playlist_result, console)
+
+    content = output.getvalue()
+    assert re.search(rf"└─ en downloads\s+│ {file_count}\s", content)
+    assert f"Downloaded {file_count} files to:" in content
+    for name in expected_names:
+        assert f"📄 {name}" in content
+    if summary:
+        assert summary in content
+        assert "video3.en.vtt" not in content
@@ -1,27 +1,58 @@
 """Tests for the downloader module."""
 
+import logging
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import pytest
 
 from video_kb_simple.downloader import SimpleDownloader
-from video_kb_simple.logger import YTDLPLogger
-from video_kb_simple.models import VideoResult
+from video_kb_simple.logger import Logger, YTDLPLogger
+from video_kb_simple.models import PlaylistDetails, PlaylistResult, PlaylistType, VideoResult
+from video_kb_simple.utils import extract_video_id_from_url, normalize_playlist_url
+from video_kb_simple.ytdlp_handler import YTDLPHandler
 
+# Log level used throughout; bound once instead of looked up on the logging module per test
+_INFO = logging.INFO
 
-class TestYTDLPLogger:
-    """Test the custom yt-dlp logger."""
 
-    def test_warning_capture(self):
-        """Test that warnings are captured correctly."""
-        import logging
+class _StubYTDL:
+    """Plain yt_dlp.YoutubeDL instance stand-in: a context manager with a canned info dict."""
+
+    def __enter__(self) -> "_StubYTDL":
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+    def extract_info(self, _url: str, download: bool = True) -> dict[str, str]:
+        assert download
+        return {"id": "dQw4w9WgXcQ", "title": "Test Video", "upload_date": "20230101"}
+
+
+# Canonical result validated once; tests derive variants with model_copy(update=...)
+_BASE_RESULT = VideoResult(
+    video_id="test123",
+    title="Test Video",
+    url="https://example.com",
+    warnings=[],
+    errors=[],
+    downloaded_files=[],
+)
 
-        from rich.console import Console
 
-        from video_kb_simple.downloader import Logger
+@pytest.fixture(scope="module")
+def logger():
+    """Console logger stand-in; YTDLPLogger keeps its own captured messages."""
+    return Mock(spec=Logger)
 
-        console = Console()
-        logger = Logger(console, logging.INFO)
-        ytdlp_logger = YTDLPLogger(logger, logging.INFO, "test123")
+
+class TestYTDLPLogger:
+    """Test the custom yt-dlp logger."""
+
+    def test_warning_capture(self, logger):
+        """Test that warnings are captured correctly."""
+        ytdlp_logger = YTDLPLogger(logger, _INFO, "test123")
 
         # Test warning capture
         ytdlp_logger.warning("Test warning message")
@@ -32,17 +63,9 @@ class TestYTDLPLogger:
         assert "[YT-DLP] \\[test123] Test warning message" in warnings
         assert "[YT-DLP] \\[test123] Another warning" in warnings
 
-    def test_error_capture(self):
+    def test_error_capture(self, logger):
         """Test that errors are captured correctly."""
-        import logging
-
-        from rich.console import Console
-
-        from video_kb_simple.downloader import Logger
-
-        console = Console()
-        logger = Logger(console, logging.INFO)
-        ytdlp_logger = YTDLPLogger(logger, logging.INFO, "test123")
+        ytdlp_logger = YTDLPLogger(logger, _INFO, "test123")
 
         # Test error capture
         ytdlp_logger.error("Test error message")
@@ -51,17 +74,9 @@ class TestYTDLPLogger:
         assert len(errors) == 1
         assert "[YT-DLP] \\[test123] Test error message" in errors[0]
 
-    def test_has_warnings_or_errors(self):
+    def test_has_warnings_or_errors(self, logger):
         """Test the has_warnings_or_errors method."""
-        import logging
-
-        from rich.console import Console
-
-        from video_kb_simple.downloader import Logger
-
-        console = Console()
-        logger = Logger(console, logging.INFO)
-        ytdlp_logger = YTDLPLogger(logger, logging.INFO, "test123")
+        ytdlp_logger = YTDLPLogger(logger, _INFO, "test123")
 
         assert not ytdlp_logger.has_warnings_or_errors()
 
@@ -69,112 +84,89 @@ class TestYTDLPLogger:
         assert ytdlp_logger.has_warnings_or_errors()
 
         # Reset logger
-        ytdlp_logger = YTDLPLogger(logger, logging.INFO, "test123")
+        ytdlp_logger = YTDLPLogger(logger, _INFO, "test123")
         ytdlp_logger.error("Test error")
         assert ytdlp_logger.has_warnings_or_errors()
 
 
-class TestVideoResult:
-    """Test VideoResult model with warnings and errors."""
+@pytest.mark.parametrize(
+    ("options", "expected_extractions"),
+    [({}, 1), ({"refresh_cache": True}, 2), ({"force_download": True}, 2)],
+    ids=["cached", "refresh", "force"],
+)
+def test_downloader_reuses_cached_playlist_details(
+    tmp_path, playlist_details, options, expected_extractions
+):
+    """Test that repeat extraction is served from the cache unless refreshed or forced."""
+    downloader = SimpleDownloader(output_dir=tmp_path, cache_dir=tmp_path / "cache", **options)
 
-    def test_video_result_with_warnings(self):
-        """Test that VideoResult can store warnings."""
-        result = VideoResult(
-            video_id="test123",
-            title="Test Video",
-            url="https://example.com",
-            warnings=["Warning 1", "Warning 2"],
-            errors=[],
-        )
+    with patch.object(
+        downloader.ytdlp_handler, "_extract_playlist_details", return_value=playlist_details
+    ) as mock_extract:
+        for _ in range(2):
+            details = downloader._get_playlist_details(playlist_details.url, PlaylistType.PLAYLIST)
+            assert details == playlist_details
 
-        assert result.video_id == "test123"
-        assert result.warnings == ["Warning 1", "Warning 2"]
-        assert result.errors == []
-        assert result.is_full_success is False  # Has warnings, so not fully successful
-        assert result.is_partial_success is True  # But it's partially successful
-
-    def test_video_result_with_errors(self):
-        """Test that VideoResult can store errors."""
-        result = VideoResult(
-            video_id="test123",
-            title="Test Video",
-            url="https://example.com",
-            warnings=["Warning 1"],
-            errors=["Error 1", "Error 2"],
-        )
+    assert mock_extract.call_count == expected_extractions
 
-        assert result.video_id == "test123"
-        assert result.warnings == ["Warning 1"]
-        assert result.errors == ["Error 1", "Error 2"]
-        assert result.is_fail is True
-
-    def test_video_result_partial_success(self):
-        """Test VideoResult partial success state."""
-        result = VideoResult(
-            video_id="test123",
-            title="Test Video",
-            url="https://example.com",
-            warnings=["Warning 1"],
-            errors=[],
-        )
 
-        assert result.is_partial_success is True
-        assert result.is_full_success is False
-        assert result.is_fail is False
+class TestVideoResult:
+    """Test VideoResult model with warnings and errors."""
 
-    def test_video_result_fully_successful(self):
-        """Test VideoResult fully successful state."""
-        result = VideoResult(
-            video_id="test123",
-            title="Test Video",
-            url="https://example.com",
-            warnings=[],
-            errors=[],
-        )
+    @pytest.mark.parametrize(
+        ("warnings", "errors", "full", "partial", "fail"),
+        [
+            ([], [], True, False, False),
+            (["Warning 1", "Warning 2"], [], False, True, False),
+            ([], ["Error 1"], False, False, True),
+            (["Warning 1"], ["Error 1", "Error 2"], False, False, True),
+        ],
+        ids=["full-success", "warnings-only", "errors-only", "warnings-and-errors"],
+    )
+    def test_states(self, warnings, errors, full, partial, fail):
+        """Test that stored warnings/errors drive the success/partial/fail states."""
+        result = _BASE_RESULT.model_copy(update={"warnings": warnings, "errors": errors})
 
-        assert result.is_partial_success is False
-        assert result.is_full_success is True
-        assert result.is_fail is False
+        assert result.video_id == "test123"
+        assert result.warnings == warnings
+        assert result.errors == errors
+        assert result.is_full_success is full
+        assert result.is_partial_success is partial
+        assert result.is_fail is fail
 
-    def test_video_result_failed(self):
-        """Test VideoResult failed state."""
-        result = VideoResult(
-            video_id="test123",
-            title="Test Video",
-            url="https://example.com",
-            warnings=["Warning 1"],
-            errors=["Error 1"],
-        )
 
-        assert result.is_partial_success is False
-        assert result.is_full_success is False
-        assert result.is_fail is True
+@pytest.fixture(scope="class")
+def downloader(tmp_path_factory):
+    """One downloader per test class, for tests that only call into it."""
+    return SimpleDownloader(output_dir=tmp_path_factory.mktemp("dl"), log_level=_INFO)
 
 
 class TestSimpleDownloader:
     """Test the SimpleDownloader class."""
 
-    def test_downloader_initialization(self):
-        """Test that downloader initializes correctly."""
-        import logging
-
-        output_dir = Path("/tmp/test")
-        downloader = SimpleDownloader(
-            output_dir=output_dir, log_level=logging.INFO, force_download=True
+    @pytest.fixture(autouse=True)
+    def _patch_fs(self, monkeypatch):
+        """Keep tests off the filesystem: no existing files found, renames are no-ops."""
+        monkeypatch.setattr(
+            YTDLPHandler, "_scan_downloaded_files", lambda _self, _video_id, _file_index=None: []
         )
+        monkeypatch.setattr(
+            YTDLPHandler,
+            "_rename_files_with_slug",
+            lambda _self, files, _video_id, _slug: files,
+        )
+
+    def test_downloader_initialization(self, tmp_path):
+        """Test that downloader initializes correctly."""
+        output_dir = tmp_path
+        downloader = SimpleDownloader(output_dir=output_dir, log_level=_INFO, force_download=True)
 
         assert downloader.output_dir == output_dir
-        assert downloader.log_level == logging.INFO
+        assert downloader.log_level == _INFO
         assert downloader.force_download is True
 
-    def test_download_with_simulated_warning(self):
+    def test_download_with_simulated_warning(self, downloader):
         """Test download process with simulated yt-dlp warning."""
-        # Create downloader
-        import logging
-
-        output_dir = Path("/tmp/test")
-        downloader = SimpleDownloader(output_dir=output_dir, log_level=logging.INFO)
-
         # Mock the download result
         mock_result = VideoResult(
             video_id="dQw4w9WgXcQ",
@@ -187,11 +179,8 @@ class TestSimpleDownloader:
         )
 
         # Mock the YTDLPHandler method
-        with (
-            patch.object(
-                downloader.ytdlp_handler, "download_video_transcripts", return_value=mock_result
-            ),
-            patch.object(downloader.ytdlp_handler, "_scan_downloaded_files", return_value=[]),
+        with patch.object(
+            downloader.ytdlp_handler, "download_video_transcripts", return_value=mock_result
         ):
             # Call the download method
             result = downloader._download_video_transcripts(
@@ -199,9 +188,103 @@ class TestSimpleDownloader:
             )
 
         # Verify the result structure
-        assert isinstance(result, VideoResult)
+        assert type(result) is VideoResult
+        assert result.video_id == "dQw4w9WgXcQ"
+        assert result.title == "Test Video"
+
+    def test_download_with_mocked_ytdlp(self, downloader):
+        """Test the yt-dlp download path end to end with YoutubeDL mocked out."""
+        with patch("yt_dlp.YoutubeDL", return_value=_StubYTDL()) as mock_ytdl_class:
+            result = downloader._download_video_transcripts(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", ["en"]
+            )
+
+        assert result.is_full_success
         assert result.video_id == "dQw4w9WgXcQ"
         assert result.title == "Test Video"
+        ytdlp_options = mock_ytdl_class.call_args.args[0]
+        assert ytdlp_options["subtitleslangs"] == ["en"]
+        assert ytdlp_options["skip_download"] is True
+
+
+def test_index_downloaded_files(tmp_path):
+    """Test that one directory scan groups existing files by video ID."""
+    names = (
+        "2023-01-01_dQw4w9WgXcQ_never-gonna.en.vtt",
+        "2023-01-01_dQw4w9WgXcQ.info.json",
+        "NA_a_b-c_d-e_f.info.json",
+        "notes.txt",
+    )
+    for name in names:
+        (tmp_path / name).write_text("")
+    (tmp_path / "NA_subdirectory").mkdir()
+
+    handler = YTDLPHandler(output_dir=tmp_path)
+    file_index = handler._index_downloaded_files()
+
+    assert {video_id: sorted(p.name for p in paths) for video_id, paths in file_index.items()} == {
+        "dQw4w9WgXcQ": sorted(names[:2]),
+        "a_b-c_d-e_f": [names[2]],
+    }
+    assert YTDLPHandler(output_dir=tmp_path / "missing")._index_downloaded_files() == {}
+
+    # Lookups through the index match a directory glob without touching the filesystem again
+    with patch.object(Path, "glob") as mock_glob:
+        indexed_files = handler._scan_downloaded_files("dQw4w9WgXcQ", file_index)
+        assert handler._scan_downloaded_files("otherVideo1", file_index) == []
+    mock_glob.assert_not_called()
+    assert sorted(indexed_files, key=str) == sorted(
+        handler._scan_downloaded_files("dQw4w9WgXcQ"), key=str
+    )
+
+
+@pytest.mark.parametrize(
+    ("metadata", "reads_metadata"),
+    [
+        (b'{"id": "dQw4w9WgXcQ", "title": "Caf\xc3\xa9", "upload_date": "20230101"}', True),
+        (b'{"title": "\xff"}', False),
+    ],
+    ids=["valid", "invalid-utf8"],
+)
+def test_existing_download_reads_metadata(tmp_path, metadata, reads_metadata):
+    """Test that a complete existing download is served from its .info.json file."""
+    (tmp_path / "2023-01-01_dQw4w9WgXcQ_cafe.en.vtt").write_text("WEBVTT")
+    (tmp_path / "2023-01-01_dQw4w9WgXcQ_cafe.info.json").write_bytes(metadata)
+    downloader = SimpleDownloader(output_dir=tmp_path, log_level=logging.ERROR)
+
+    with patch.object(
+        downloader.ytdlp_handler, "download_video_transcripts", return_value=_BASE_RESULT
+    ) as mock_download:
+        result = downloader._download_video_transcripts(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", ["en"]
+        )
+
+    if reads_metadata:
+        mock_download.assert_not_called()
+        assert result.title == "Café"
+        assert result.upload_date == "20230101"
+        assert len(result.downloaded_files) == 2
+    else:
+        # Unreadable metadata falls back to a regular download instead of raising
+        mock_download.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("url", "video_id", "playlist_type"),
+    [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=1", "dQw4w9WgXcQ", "single_video"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ", "single_video"),
+        ("https://youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ", "single_video"),
+        ("https://www.youtube.com/v/dQw4w9WgXcQ", "dQw4w9WgXcQ", "single_video"),
+        ("https://www.youtube.com/@channel", None, "channel_videos"),
+        ("https://www.youtube.com/playlist?list=PL123", None, "playlist"),
+    ],
+    ids=["watch", "short-link", "embed", "v-path", "channel", "playlist"],
+)
+def test_url_parsing(url, video_id, playlist_type):
+    """Test video ID extraction and playlist type detection across URL forms."""
+    assert extract_video_id_from_url(url) == video_id
+    assert normalize_playlist_url(url)[1].value == playlist_type
 
 
 class TestCLIReporting:
@@ -209,34 +292,23 @@ class TestCLIReporting:
 
     def test_cli_counts_different_result_types(self):
         """Test that CLI correctly counts fully successful, partial success, and failed videos."""
-        from video_kb_simple.models import PlaylistDetails, PlaylistResult, PlaylistType
-
         # Create test video results
-        fully_successful_result = VideoResult(
-            video_id="test1",
-            title="Fully Successful Video",
-            url="https://youtube.com/watch?v=test1",
-            warnings=[],
-            errors=[],
-            downloaded_files=[],
+        fully_successful_result = _BASE_RESULT.model_copy(
+            update={"video_id": "test1", "title": "Fully Successful Video"}
         )
-
-        partial_success_result = VideoResult(
-            video_id="test2",
-            title="Partial Success Video",
-            url="https://youtube.com/watch?v=test2",
-            warnings=["Warning: Some subtitles missing"],
-            errors=[],
-            downloaded_files=[],
+        partial_success_result = _BASE_RESULT.model_copy(
+            update={
+                "video_id": "test2",
+                "title": "Partial Success Video",
+                "warnings": ["Warning: Some subtitles missing"],
+            }
         )
-
-        failed_result = VideoResult(
-            video_id="test3",
-            title="Failed Video",
-            url="https://youtube.com/watch?v=test3",
-            warnings=[],
-            errors=["Error: Download failed"],
-            downloaded_files=[],
+        failed_result = _BASE_RESULT.model_copy(
+            update={
+                "video_id": "test3",
+                "title": "Failed Video",
+                "errors": ["Error: Download failed"],
+            }
         )
 
         # Create playlist result
@@ -253,12 +325,15 @@ class TestCLIReporting:
             processing_time_seconds=1.5,
         )
 
-        # Test the counting logic directly
-        fully_successful = sum(1 for vr in playlist_result.video_results if vr.is_full_success)
-        partial_success = sum(1 for vr in playlist_result.video_results if vr.is_partial_success)
-        failed = sum(1 for vr in playlist_result.video_results if vr.is_fail)
+        # Test the counting logic directly, in one pass over the results
+        fully_successful = partial_success = failed = 0
+        for vr in playlist_result.video_results:
+            fully_successful += vr.is_full_success
+            partial_success += vr.is_partial_success
+            failed += vr.is_fail
 
-        # Verify the counts are correct
+        # Verify the counts are correct and match the model's single-pass tally
         assert fully_successful == 1
         assert partial_success == 1
         assert failed == 1
+        assert playlist_result.status_counts == (1, 1, 1)
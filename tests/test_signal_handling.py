@@ -1,7 +1,17 @@
 """Tests for shutdown handling functionality in the downloader."""
 
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
 from unittest.mock import patch
 
+import pytest
+
 from video_kb_simple.downloader import SimpleDownloader
 from video_kb_simple.models import (
     PlaylistDetails,
@@ -11,158 +21,307 @@ from video_kb_simple.models import (
 )
 
 
-class TestShutdownHandling:
-    """Test cases for shutdown handling functionality."""
+def _shutdown_after(checks: int) -> Callable[[], bool]:
+    """Return a shutdown callback that starts returning True after `checks` calls."""
+    calls = 0
 
-    def test_downloader_initializes_without_signal_handlers(self):
-        """Test that SimpleDownloader does not set up signal handlers by default."""
-        # Create downloader without shutdown_check callback
-        downloader = SimpleDownloader()
+    def shutdown_check() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls > checks
 
-        # Should not have any shutdown_check callback set
-        assert downloader.shutdown_check is None
+    return shutdown_check
 
-    def test_downloader_with_custom_shutdown_check(self):
-        """Test that SimpleDownloader accepts custom shutdown_check callback."""
-        shutdown_flag = False
 
-        def custom_shutdown_check():
-            return shutdown_flag
+def _failing_shutdown_check() -> bool:
+    raise Exception("Callback failed")
 
-        # Create downloader with custom shutdown check
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
 
-        # Should have the callback set
-        assert downloader.shutdown_check is not None
-        assert not downloader.shutdown_check()
+# Runs a concurrent playlist download whose workers never finish, under the CLI's handler
+_BLOCKED_WORKERS_SCRIPT = """
+import logging, sys, threading
+from pathlib import Path
+from unittest.mock import patch
+from rich.console import Console
+from video_kb_simple.cli import create_signal_handler
+from video_kb_simple.downloader import SimpleDownloader
+from video_kb_simple.models import PlaylistDetails, PlaylistType
 
-        # Change the flag and test
-        shutdown_flag = True
-        assert downloader.shutdown_check()
+started = threading.Semaphore(0)
 
-    def test_is_shutdown_requested_without_callback(self):
-        """Test _is_shutdown_requested returns False when no callback provided."""
-        downloader = SimpleDownloader()
+def blocked_download(*_args, **_kwargs):
+    started.release()
+    threading.Event().wait()
 
-        # Should return False when no callback is provided
-        assert not downloader._is_shutdown_requested()
+downloader = SimpleDownloader(
+    output_dir=Path(sys.argv[1]),
+    log_level=logging.ERROR,
+    shutdown_check=create_signal_handler(Console(stderr=True)),
+    concurrency=2,
+)
+playlist = PlaylistDetails(
+    playlist_id="test",
+    playlist_type=PlaylistType.PLAYLIST,
+    title="Test",
+    url="https://youtube.com/playlist?list=test",
+    video_urls=[f"https://youtube.com/watch?v=test{i}" for i in range(4)],
+)
+threading.Thread(
+    target=lambda: (started.acquire(), started.acquire(), print("ready", flush=True)),
+    daemon=True,
+).start()
+with patch.object(downloader, "_download_video_transcripts", side_effect=blocked_download):
+    downloader._download_playlist_transcripts(playlist)
+"""
+
+
+@pytest.fixture(scope="module")
+def downloader_factory(tmp_path_factory):
+    """Return a factory for downloaders that share one temporary output directory."""
+    output_dir = tmp_path_factory.mktemp("transcripts")
+
+    def make_downloader(
+        shutdown_check: Callable[[], bool] | None = None, **kwargs
+    ) -> SimpleDownloader:
+        return SimpleDownloader(output_dir=output_dir, shutdown_check=shutdown_check, **kwargs)
+
+    return make_downloader
+
+
+@pytest.fixture(scope="module")
+def sample_playlist() -> PlaylistDetails:
+    """A five-video playlist; tests derive shorter variants with model_copy."""
+    return PlaylistDetails(
+        playlist_id="test_playlist",
+        playlist_type=PlaylistType.PLAYLIST,
+        title="Test Playlist",
+        url="https://youtube.com/playlist?list=test",
+        video_urls=[f"https://youtube.com/watch?v=test{i}" for i in range(1, 6)],
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_video_result() -> VideoResult:
+    """A fully successful video result returned by mocked downloads."""
+    return VideoResult(
+        video_id="test1",
+        title="Test Video",
+        url="https://youtube.com/watch?v=test1",
+        warnings=[],
+        errors=[],
+        downloaded_files=[],
+    )
 
-    def test_is_shutdown_requested_with_callback(self):
-        """Test _is_shutdown_requested uses callback when provided."""
-        shutdown_flag = False
 
-        def custom_shutdown_check():
-            return shutdown_flag
+class TestShutdownHandling:
+    """Test cases for shutdown handling functionality."""
 
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
+    @pytest.mark.parametrize(
+        ("shutdown_check", "expected"),
+        [
+            (None, False),
+            (lambda: False, False),
+            (lambda: True, True),
+            (_failing_shutdown_check, False),
+        ],
+        ids=["no-callback", "not-requested", "requested", "callback-raises"],
+    )
+    def test_is_shutdown_requested(self, downloader_factory, shutdown_check, expected):
+        """Test that _is_shutdown_requested follows the callback and tolerates its failures."""
+        downloader = downloader_factory(shutdown_check)
+
+        # No signal handlers are installed; the downloader only keeps the callback
+        assert downloader.shutdown_check is shutdown_check
+        assert downloader._is_shutdown_requested() is expected
+
+    def test_is_shutdown_requested_reads_callback_each_time(self, downloader_factory):
+        """Test that a shutdown requested after construction is picked up."""
+        shutdown_flag = False
+        downloader = downloader_factory(lambda: shutdown_flag)
 
-        # Initially False
         assert not downloader._is_shutdown_requested()
-
-        # Change flag
         shutdown_flag = True
         assert downloader._is_shutdown_requested()
 
-    def test_playlist_processing_respects_shutdown_callback(self):
-        """Test that playlist processing loop respects shutdown callback."""
-        shutdown_flag = False
-
-        def custom_shutdown_check():
-            return shutdown_flag
-
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
-
-        # Create proper playlist details
-        playlist_details = PlaylistDetails(
-            playlist_id="test_playlist",
-            playlist_type=PlaylistType.PLAYLIST,
-            title="Test Playlist",
-            url="https://youtube.com/playlist?list=test",
-            video_urls=[
-                "https://youtube.com/watch?v=test1",
-                "https://youtube.com/watch?v=test2",
-                "https://youtube.com/watch?v=test3",
-            ],
-        )
-
-        # Create proper video result
-        video_result = VideoResult(
-            video_id="test1",
-            title="Test Video",
-            url="https://youtube.com/watch?v=test1",
-            warnings=[],
-            errors=[],
-            downloaded_files=[],
+    @pytest.mark.parametrize(
+        ("video_count", "stop_after", "expected_calls"),
+        [(3, 3, 3), (3, 2, 2), (3, 0, 0)],
+        ids=["never-stops", "stops-after-two", "stops-immediately"],
+    )
+    def test_playlist_processing_respects_shutdown_callback(
+        self,
+        downloader_factory,
+        sample_playlist,
+        sample_video_result,
+        video_count,
+        stop_after,
+        expected_calls,
+    ):
+        """Test that the playlist loop checks for shutdown before each video."""
+        downloader = downloader_factory(_shutdown_after(stop_after))
+
+        playlist_details = sample_playlist.model_copy(
+            update={"video_urls": sample_playlist.video_urls[:video_count]}
         )
 
         # Mock the video download method
         with patch.object(downloader, "_download_video_transcripts") as mock_download:
-            mock_download.return_value = video_result
-
-            # Process first video, then set shutdown flag
-            shutdown_flag = False
-
-            result = downloader._download_playlist_transcripts(playlist_details, max_videos=3)
+            mock_download.return_value = sample_video_result
 
-            # Should have processed all videos since shutdown was never triggered
-            assert mock_download.call_count == 3
-            assert result.total_requested == 3
-            assert len(result.video_results) == 3
+            result = downloader._download_playlist_transcripts(
+                playlist_details, max_videos=video_count
+            )
 
-    def test_playlist_processing_stops_on_shutdown(self):
-        """Test that playlist processing stops when shutdown callback returns True."""
-        call_count = 0
+            assert mock_download.call_count == expected_calls
+            assert result.total_requested == video_count
+            assert len(result.video_results) == expected_calls
+
+    def test_concurrent_playlist_processing_keeps_order(self, downloader_factory, sample_playlist):
+        """Test that parallel downloads return results in playlist order."""
+        downloader = downloader_factory(concurrency=3)
+
+        def fake_download(video_url, _languages, **_kwargs):
+            return VideoResult(video_id=video_url[-5:], url=video_url)
+
+        with patch.object(downloader, "_download_video_transcripts", side_effect=fake_download):
+            result = downloader._download_playlist_transcripts(sample_playlist)
+
+        assert [video.url for video in result.video_results] == sample_playlist.video_urls
+
+    def test_playlist_processing_skips_duplicate_videos(
+        self, downloader_factory, sample_playlist, sample_video_result
+    ):
+        """Test that a video listed twice (under different URL forms) is downloaded once."""
+        downloader = downloader_factory()
+        playlist_details = sample_playlist.model_copy(
+            update={
+                "video_urls": [
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    "https://youtu.be/dQw4w9WgXcQ",
+                    *sample_playlist.video_urls[:2],
+                    sample_playlist.video_urls[0],
+                ]
+            }
+        )
 
-        def custom_shutdown_check():
-            nonlocal call_count
-            call_count += 1
-            # Return True after processing 2 videos
-            return call_count > 2
+        with patch.object(downloader, "_download_video_transcripts") as mock_download:
+            mock_download.return_value = sample_video_result
+            result = downloader._download_playlist_transcripts(playlist_details)
 
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
+        assert [call.args[0] for call in mock_download.call_args_list] == [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            *sample_playlist.video_urls[:2],
+        ]
+        assert result.total_requested == 3
+
+    @pytest.mark.parametrize("concurrency", [1, 3], ids=["serial", "concurrent"])
+    def test_playlist_processing_reports_progress(
+        self, downloader_factory, sample_playlist, sample_video_result, concurrency
+    ):
+        """Test that the progress callback gets the video count, then each finished video."""
+        progress_calls = []
+        downloader = downloader_factory(
+            concurrency=concurrency,
+            progress_callback=lambda *args: progress_calls.append(args),
+        )
 
-        # Create proper playlist details
-        playlist_details = PlaylistDetails(
+        with patch.object(downloader, "_download_video_transcripts") as mock_download:
+            mock_download.return_value = sample_video_result
+            downloader._download_playlist_transcripts(sample_playlist)
+
+        assert progress_calls == [
+            (0, 5, None),
+            *((i, 5, sample_video_result) for i in range(1, 6)),
+        ]
+
+    @staticmethod
+    def _download_until_shutdown(downloader_factory, concurrency: int) -> PlaylistResult:
+        """Run a six-video playlist where shutdown is requested while the first videos run."""
+        shutdown = threading.Event()
+        # Every worker is busy with a video before the shutdown request arrives
+        all_workers_busy = threading.Barrier(concurrency)
+
+        def fake_download(video_url, video_id, _languages):
+            # Mirrors YTDLPHandler: a download started after shutdown reports cancellation
+            if shutdown.is_set():
+                return VideoResult(video_id=video_id, url=video_url, errors=["Download cancelled"])
+            all_workers_busy.wait(timeout=5)
+            shutdown.set()
+            return VideoResult(video_id=video_id, title="Test Video", url=video_url)
+
+        downloader = downloader_factory(shutdown.is_set, concurrency=concurrency)
+        playlist = PlaylistDetails(
             playlist_id="test_playlist",
             playlist_type=PlaylistType.PLAYLIST,
             title="Test Playlist",
             url="https://youtube.com/playlist?list=test",
-            video_urls=[
-                "https://youtube.com/watch?v=test1",
-                "https://youtube.com/watch?v=test2",
-                "https://youtube.com/watch?v=test3",
-            ],
+            video_urls=[f"https://www.youtube.com/watch?v=video{i:06d}" for i in range(6)],
         )
 
-        # Create proper video result
-        video_result = VideoResult(
-            video_id="test1",
-            title="Test Video",
-            url="https://youtube.com/watch?v=test1",
-            warnings=[],
-            errors=[],
-            downloaded_files=[],
+        with patch.object(
+            downloader.ytdlp_handler, "download_video_transcripts", side_effect=fake_download
+        ):
+            return downloader._download_playlist_transcripts(playlist)
+
+    def test_concurrent_shutdown_matches_serial(self, downloader_factory):
+        """Test that queued videos are skipped, not failed, when shutdown stops parallel runs.
+
+        Serial and parallel runs both keep exactly the downloads that were already
+        running and report no failures; they differ only in how many were running.
+        """
+        serial = self._download_until_shutdown(downloader_factory, concurrency=1)
+        concurrent = self._download_until_shutdown(downloader_factory, concurrency=3)
+
+        assert serial.status_counts == (1, 0, 0)
+        assert concurrent.status_counts == (3, 0, 0)
+        serial_urls = [video.url for video in serial.video_results]
+        concurrent_urls = [video.url for video in concurrent.video_results]
+        assert concurrent_urls[: len(serial_urls)] == serial_urls
+        assert concurrent_urls == [
+            f"https://www.youtube.com/watch?v=video{i:06d}" for i in range(3)
+        ]
+
+    def test_second_interrupt_exits_with_busy_workers(self, tmp_path):
+        """Test that a second Ctrl+C exits at once instead of waiting for running downloads."""
+        process = subprocess.Popen(
+            [sys.executable, "-c", _BLOCKED_WORKERS_SCRIPT, str(tmp_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
         )
-
-        # Mock the video download method
-        with patch.object(downloader, "_download_video_transcripts") as mock_download:
-            mock_download.return_value = video_result
-
-            result = downloader._download_playlist_transcripts(playlist_details, max_videos=3)
-
-            # Should have only processed 2 videos (shutdown after 2nd check)
-            assert mock_download.call_count == 2
-            assert result.total_requested == 3
-            assert len(result.video_results) == 2
-
-    def test_video_download_respects_shutdown_callback(self):
+        try:
+            assert process.stdout is not None
+            assert process.stderr is not None
+            assert process.stdout.readline().strip() == "ready"
+
+            # Pending signals are a flag, not a count: wait until the first one is handled
+            process.send_signal(signal.SIGINT)
+            deadline = time.monotonic() + 5
+            output = b""
+            while b"Shutdown requested" not in output:
+                remaining = deadline - time.monotonic()
+                assert remaining > 0, "first Ctrl+C was not handled"
+                if select.select([process.stderr], [], [], remaining)[0]:
+                    output += os.read(process.stderr.fileno(), 1024)
+            start = time.monotonic()
+            process.send_signal(signal.SIGINT)
+            exit_code = process.wait(timeout=10)
+            elapsed = time.monotonic() - start
+        finally:
+            process.kill()
+            process.wait()
+
+        assert exit_code == 1
+        assert elapsed < 2
+
+    def test_video_download_respects_shutdown_callback(self, downloader_factory):
         """Test that video download respects shutdown callback."""
         shutdown_flag = True
 
         def custom_shutdown_check():
             return shutdown_flag
 
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
+        downloader = downloader_factory(custom_shutdown_check)
 
         # Mock YTDLPHandler to simulate shutdown
         with patch.object(downloader.ytdlp_handler, "download_video_transcripts") as mock_download:
@@ -187,14 +346,14 @@ class TestShutdownHandling:
             # Verify the mock was called
             mock_download.assert_called_once()
 
-    def test_video_download_continues_when_no_shutdown(self):
+    def test_video_download_continues_when_no_shutdown(self, downloader_factory):
         """Test that video download continues when shutdown callback returns False."""
         shutdown_flag = False
 
         def custom_shutdown_check():
             return shutdown_flag
 
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
+        downloader = downloader_factory(custom_shutdown_check)
 
         # Mock YTDLPHandler for successful download
         with patch.object(downloader.ytdlp_handler, "download_video_transcripts") as mock_download:
@@ -216,14 +375,14 @@ class TestShutdownHandling:
             assert result.is_full_success
             assert result.title == "Test Video"
 
-    def test_shutdown_logging_in_main_download_method(self):
+    def test_shutdown_logging_in_main_download_method(self, downloader_factory):
         """Test that shutdown status is logged in main download method."""
         shutdown_flag = True
 
         def custom_shutdown_check():
             return shutdown_flag
 
-        downloader = SimpleDownloader(shutdown_check=custom_shutdown_check)
+        downloader = downloader_factory(custom_shutdown_check)
 
         # Use a proper YouTube URL format that will be recognized
         test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -240,69 +399,34 @@ class TestShutdownHandling:
                 # but we can verify the method completes and returns a result
                 assert isinstance(result, PlaylistResult)
 
-    def test_shutdown_callback_exception_handling(self):
-        """Test that exceptions in shutdown callback are handled gracefully."""
-
-        def failing_shutdown_check():
-            raise Exception("Callback failed")
-
-        downloader = SimpleDownloader(shutdown_check=failing_shutdown_check)
-
-        # Should return False when callback raises exception
-        assert not downloader._is_shutdown_requested()
-
 
 class TestShutdownHandlingIntegration:
     """Integration tests for shutdown handling in realistic scenarios."""
 
-    def test_multiple_videos_with_shutdown(self):
+    def test_multiple_videos_with_shutdown(
+        self, downloader_factory, sample_playlist, sample_video_result
+    ):
         """Test processing multiple videos with shutdown triggered midway."""
-        video_count = 0
-
-        def shutdown_after_two_videos():
-            nonlocal video_count
-            video_count += 1
-            return video_count > 2
-
-        downloader = SimpleDownloader(shutdown_check=shutdown_after_two_videos)
-
-        # Create playlist with 5 videos
-        playlist_details = PlaylistDetails(
-            playlist_id="test_playlist",
-            playlist_type=PlaylistType.PLAYLIST,
-            title="Test Playlist",
-            url="https://youtube.com/playlist?list=test",
-            video_urls=[f"https://youtube.com/watch?v=test{i}" for i in range(1, 6)],
-        )
-
-        # Create successful video result
-        video_result = VideoResult(
-            video_id="test1",
-            title="Test Video",
-            url="https://youtube.com/watch?v=test1",
-            warnings=[],
-            errors=[],
-            downloaded_files=[],
-        )
+        downloader = downloader_factory(_shutdown_after(2))
 
         with patch.object(downloader, "_download_video_transcripts") as mock_download:
-            mock_download.return_value = video_result
+            mock_download.return_value = sample_video_result
 
-            result = downloader._download_playlist_transcripts(playlist_details, max_videos=5)
+            result = downloader._download_playlist_transcripts(sample_playlist, max_videos=5)
 
             # Should have processed exactly 2 videos before shutdown
             assert mock_download.call_count == 2
             assert len(result.video_results) == 2
             assert result.total_requested == 5
 
-    def test_shutdown_during_single_video_download(self):
+    def test_shutdown_during_single_video_download(self, downloader_factory):
         """Test shutdown during single video download."""
         shutdown_flag = True
 
         def immediate_shutdown():
             return shutdown_flag
 
-        downloader = SimpleDownloader(shutdown_check=immediate_shutdown)
+        downloader = downloader_factory(immediate_shutdown)
 
         # Use a proper YouTube URL format that will pass video ID extraction
         test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -314,33 +438,25 @@ class TestShutdownHandlingIntegration:
         assert result.errors
         assert "cancelled by user" in " ".join(result.errors)
 
-    def test_no_shutdown_callback_provided(self):
+    def test_no_shutdown_callback_provided(
+        self, downloader_factory, sample_playlist, sample_video_result
+    ):
         """Test behavior when no shutdown callback is provided."""
-        downloader = SimpleDownloader()
+        downloader = downloader_factory()
 
         # Should work normally without shutdown interruptions
         assert not downloader._is_shutdown_requested()
 
         # Create a simple test case
-        playlist_details = PlaylistDetails(
-            playlist_id="test",
-            playlist_type=PlaylistType.SINGLE_VIDEO,
-            title="Test",
-            url="https://youtube.com/watch?v=test",
-            video_urls=["https://youtube.com/watch?v=test"],
-        )
-
-        video_result = VideoResult(
-            video_id="test",
-            title="Test Video",
-            url="https://youtube.com/watch?v=test",
-            warnings=[],
-            errors=[],
-            downloaded_files=[],
+        playlist_details = sample_playlist.model_copy(
+            update={
+                "playlist_type": PlaylistType.SINGLE_VIDEO,
+                "video_urls": sample_playlist.video_urls[:1],
+            }
         )
 
         with patch.object(downloader, "_download_video_transcripts") as mock_download:
-            mock_download.return_value = video_result
+            mock_download.return_value = sample_video_result
 
             result = downloader._download_playlist_transcripts(playlist_details)
 
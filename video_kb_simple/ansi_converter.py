@@ -1,263 +1,331 @@
 """ANSI escape sequence to Rich markup converter."""
 
-import re
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from rich.markup import escape
+
+# Inputs up to this length are memoized by ANSIConverter.convert
+CONVERT_CACHE_MAX_LENGTH = 256
+CONVERT_CACHE_SIZE = 1024
+
+# ANSI color code mappings to Rich colors (read-only views, shared by all converters)
+COLOR_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "30": "black",
+        "31": "red",
+        "32": "green",
+        "33": "yellow",
+        "34": "blue",
+        "35": "magenta",
+        "36": "cyan",
+        "37": "white",
+        "90": "bright_black",
+        "91": "bright_red",
+        "92": "bright_green",
+        "93": "bright_yellow",
+        "94": "bright_blue",
+        "95": "bright_magenta",
+        "96": "bright_cyan",
+        "97": "bright_white",
+    }
+)
+
+# Background color mappings
+BG_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "40": "black",
+        "41": "red",
+        "42": "green",
+        "43": "yellow",
+        "44": "blue",
+        "45": "magenta",
+        "46": "cyan",
+        "47": "white",
+        "100": "bright_black",
+        "101": "bright_red",
+        "102": "bright_green",
+        "103": "bright_yellow",
+        "104": "bright_blue",
+        "105": "bright_magenta",
+        "106": "bright_cyan",
+        "107": "bright_white",
+    }
+)
+
+# Style mappings
+STYLE_MAP: Mapping[str, str] = MappingProxyType({"1": "bold", "4": "underline", "7": "reverse"})
+
+# SGR code kinds used by the dispatch table
+_KIND_STYLE = 0
+_KIND_FG = 1
+_KIND_BG = 2
+_KIND_RESET = 3
+_KIND_FG_256 = 4
+_KIND_BG_256 = 5
+
+# Single code -> (kind, opening Rich tag) table so each SGR code costs one dict lookup and
+# named colors/styles need no string formatting. Kept as a plain dict since it is private
+# and only read; a proxy would add a call per lookup.
+_SGR_DISPATCH: dict[str, tuple[int, str]] = {
+    **{code: (_KIND_STYLE, f"[{name}]") for code, name in STYLE_MAP.items()},
+    **{code: (_KIND_FG, f"[{name}]") for code, name in COLOR_MAP.items()},
+    **{code: (_KIND_BG, f"[{name}]") for code, name in BG_MAP.items()},
+    "0": (_KIND_RESET, ""),
+    "38": (_KIND_FG_256, ""),
+    "48": (_KIND_BG_256, ""),
+}
+
+
+def _find_sgr_sequence(text: str, search_from: int) -> tuple[int, int]:
+    """Find the next ANSI SGR sequence (ESC[ <digits/semicolons> m) in text.
 
+    Args:
+        text: Text to scan
+        search_from: Index to start scanning at
 
-class ANSIConverter:
-    """Converts ANSI escape sequences to Rich markup for proper color rendering."""
+    Returns:
+        Tuple of (start index of ESC, index of the final "m"), or (-1, -1) if none found
+    """
+    text_length = len(text)
+    while True:
+        start = text.find("\033[", search_from)
+        if start < 0:
+            return -1, -1
 
-    def __init__(self) -> None:
-        # ANSI color code mappings to Rich colors
-        self.color_map: dict[str, str] = {
-            "30": "black",
-            "31": "red",
-            "32": "green",
-            "33": "yellow",
-            "34": "blue",
-            "35": "magenta",
-            "36": "cyan",
-            "37": "white",
-            "90": "bright_black",
-            "91": "bright_red",
-            "92": "bright_green",
-            "93": "bright_yellow",
-            "94": "bright_blue",
-            "95": "bright_magenta",
-            "96": "bright_cyan",
-            "97": "bright_white",
-        }
-
-        # Background color mappings
-        self.bg_map: dict[str, str] = {
-            "40": "black",
-            "41": "red",
-            "42": "green",
-            "43": "yellow",
-            "44": "blue",
-            "45": "magenta",
-            "46": "cyan",
-            "47": "white",
-            "100": "bright_black",
-            "101": "bright_red",
-            "102": "bright_green",
-            "103": "bright_yellow",
-            "104": "bright_blue",
-            "105": "bright_magenta",
-            "106": "bright_cyan",
-            "107": "bright_white",
-        }
-
-        # Style mappings
-        self.style_map: dict[str, str] = {"1": "bold", "4": "underline", "7": "reverse"}
-
-    def convert(self, text: str) -> str:
-        """Convert ANSI escape sequences to Rich markup and escape literal brackets.
+        # Walk the parameter bytes (digits and semicolons) up to the final byte. A substring
+        # membership test beats a 256-entry byte-class table here: ord() plus a bytes index
+        # costs more per character in CPython than the single `in` on an 11-char string.
+        end = start + 2
+        while end < text_length and text[end] in "0123456789;":
+            end += 1
 
-        Args:
-            text: Text containing ANSI escape sequences and literal brackets
+        if end < text_length and text[end] == "m":
+            return start, end
 
-        Returns:
-            Text with ANSI codes converted to Rich markup and literal brackets escaped
-        """
-        from rich.markup import escape
+        # Not an SGR sequence - leave it in the text and keep scanning
+        search_from = end
 
-        # First escape all square brackets in the text
-        escaped_text = escape(text)
 
-        # Process with state tracking for proper tag management
-        return self._convert_with_state_tracking(escaped_text)
+def _convert_ansi_codes_with_state(
+    codes_str: str, current_fg: str | None, current_bg: str | None, current_styles: set[str]
+) -> tuple[str, str | None, str | None]:
+    """Convert ANSI code string to Rich markup with state management.
 
-    def _replace_ansi(self, match: re.Match[str]) -> str:
-        """Replace ANSI escape sequence with Rich markup."""
-        codes = match.group(1).split(";")
-        result = []
+    Args:
+        codes_str: ANSI codes separated by semicolons (e.g., "0;32;1")
+        current_fg: Opening tag of the current foreground color, if any
+        current_bg: Opening tag of the current background color, if any
+        current_styles: Opening tags of the current styles (mutable for updates)
+
+    Returns:
+        Tuple of (Rich markup string, new foreground tag, new background tag)
+    """
+    # Plain str.split measured fastest for the 1-3 code strings yt-dlp emits: a find()-based
+    # tokenizer was ~3x slower and a no-";" fast path made no measurable difference
+    codes = codes_str.split(";")
+    codes_count = len(codes)
+    markup_parts: list[str] = []
+
+    i = 0
+    while i < codes_count:
+        entry = _SGR_DISPATCH.get(codes[i])
+        i += 1
+        if entry is None:  # Unsupported code - ignore it
+            continue
+
+        kind, tag = entry
+        if kind == _KIND_FG:  # Foreground colors
+            if current_fg:  # Close previous foreground color
+                markup_parts.append("[/]")
+            markup_parts.append(tag)
+            current_fg = tag
+        elif kind == _KIND_RESET:  # Reset - close all current styles
+            if current_fg:
+                markup_parts.append("[/]")
+                current_fg = None
+            if current_bg:
+                markup_parts.append("[/]")
+                current_bg = None
+            for style in list(current_styles):
+                markup_parts.append("[/]")
+                current_styles.remove(style)
+        elif kind == _KIND_STYLE:  # Text styles
+            if tag not in current_styles:
+                markup_parts.append(tag)
+                current_styles.add(tag)
+        elif kind == _KIND_BG:  # Background colors
+            if current_bg:  # Close previous background color
+                markup_parts.append("[/]")
+            markup_parts.append(tag)
+            current_bg = tag
+        elif i + 1 < codes_count and codes[i] == "5":  # 256-color: 38;5;N or 48;5;N
+            color_num = codes[i + 1]
+            if color_num.isdigit() and 0 <= int(color_num) <= 255:
+                if kind == _KIND_FG_256:
+                    if current_fg:
+                        markup_parts.append("[/]")
+                    current_fg = f"[color({color_num})]"
+                    markup_parts.append(current_fg)
+                else:
+                    if current_bg:
+                        markup_parts.append("[/]")
+                    current_bg = f"[on color({color_num})]"
+                    markup_parts.append(current_bg)
+            i += 2  # Skip the "5" and the color number
+
+    return "".join(markup_parts), current_fg, current_bg
+
+
+def _escape_text(text: str) -> str:
+    """Escape Rich markup in a run of plain text taken from between ANSI sequences.
+
+    rich.markup.escape only rewrites tag-like "[" runs and a trailing backslash, so
+    runs with neither (the bulk of yt-dlp output) skip its regex pass entirely.
+    """
+    if "[" in text or text.endswith("\\"):
+        return escape(text)
+    return text
+
+
+def _convert_with_state_tracking(text: str) -> str:
+    """Convert ANSI sequences with proper state tracking for consecutive colors.
+
+    Literal brackets are escaped as the text between sequences is copied out, so
+    markup emitted for ANSI codes is never itself escaped. Text around sequences that
+    emit no markup is escaped as one run, since it renders contiguously.
+
+    Args:
+        text: Raw text containing ANSI sequences and literal brackets
 
-        # Check if we have multiple style/color codes (edge case handling)
-        has_multiple_styles = (
-            len(
-                [c for c in codes if c in self.style_map or c in self.color_map or c in self.bg_map]
+    Returns:
+        Text with ANSI codes converted to Rich markup with proper state management
+    """
+    start, end = _find_sgr_sequence(text, 0)
+    if start < 0:  # ESC bytes but no color/style sequence, e.g. yt-dlp's "\033[K" line erase
+        return _escape_text(text)
+
+    # Track current state
+    current_fg: str | None = None
+    current_bg: str | None = None
+    current_styles: set[str] = set()
+
+    # Process text with state tracking
+    result_parts: list[str] = []
+    pending_text = ""  # Plain text not yet escaped, waiting for the next markup
+    last_end = 0
+
+    while start >= 0:
+        pending_text += text[last_end:start]
+
+        # Convert ANSI sequence with state management
+        ansi_codes = text[start + 2 : end]
+        if ansi_codes:  # Skip empty sequences
+            markup, current_fg, current_bg = _convert_ansi_codes_with_state(
+                ansi_codes, current_fg, current_bg, current_styles
             )
-            > 1
-        )
-
-        i = 0
-        while i < len(codes):
-            code = codes[i]
-
-            if code == "0":  # Reset
-                result.append("[/]")
-            elif code == "1":  # Bold
-                result.append("[bold]")
-            elif code == "4":  # Underline
-                result.append("[underline]")
-            elif code in self.color_map:  # Foreground color
-                result.append(f"[{self.color_map[code]}]")
-            elif code in self.bg_map:  # Background color
-                result.append(f"[{self.bg_map[code]}]")
-            elif code.startswith("38") and len(codes) > i + 2:  # 256-color foreground
-                if codes[i + 1] == "5":  # 256-color palette
-                    color_num = codes[i + 2]
-                    if color_num.isdigit() and 0 <= int(color_num) <= 255:
-                        result.append(f"[color({color_num})]")
-                    i += 2  # Skip the next two codes
-            elif (
-                code.startswith("48") and len(codes) > i + 2 and codes[i + 1] == "5"
-            ):  # 256-color background
-                color_num = codes[i + 2]
-                if color_num.isdigit() and 0 <= int(color_num) <= 255:
-                    result.append(f"[on color({color_num})]")
-                i += 2  # Skip the next two codes
-
-            i += 1
-
-        # For combined styles, add extra reset to handle edge case
-        if has_multiple_styles and result and not result[-1].startswith("[/"):
-            result.append("[/]")
-
-        return "".join(result)
-
-    def _convert_ansi_codes_with_state(
-        self, codes_str: str, current_fg: list, current_bg: list, current_styles: set[str]
-    ) -> str:
-        """Convert ANSI code string to Rich markup with state management.
+            if markup:
+                # Add escaped text before the markup
+                if pending_text:
+                    result_parts.append(_escape_text(pending_text))
+                    pending_text = ""
+                result_parts.append(markup)
 
-        Args:
-            codes_str: ANSI codes separated by semicolons (e.g., "0;32;1")
-            current_fg: Current foreground color state (mutable list for updates)
-            current_bg: Current background color state (mutable list for updates)
-            current_styles: Current styles set (mutable for updates)
+        last_end = end + 1
+        start, end = _find_sgr_sequence(text, last_end)
 
-        Returns:
-            Rich markup string
-        """
-        codes = codes_str.split(";")
-        markup_parts: list[str] = []
-
-        i = 0
-        while i < len(codes):
-            code = codes[i]
-
-            if code == "0":  # Reset - close all current styles
-                if current_fg[0]:
-                    markup_parts.append("[/]")
-                    current_fg[0] = None
-                if current_bg[0]:
-                    markup_parts.append("[/]")
-                    current_bg[0] = None
-                for style in list(current_styles):
-                    markup_parts.append("[/]")
-                    current_styles.remove(style)
-            elif code in self.style_map:  # Text styles
-                style_name = self.style_map[code]
-                if style_name not in current_styles:
-                    markup_parts.append(f"[{style_name}]")
-                    current_styles.add(style_name)
-            elif code in self.color_map:  # Foreground colors
-                color_name = self.color_map[code]
-                if current_fg[0]:  # Close previous foreground color
-                    markup_parts.append("[/]")
-                markup_parts.append(f"[{color_name}]")
-                current_fg[0] = color_name
-            elif code in self.bg_map:  # Background colors
-                color_name = self.bg_map[code]
-                if current_bg[0]:  # Close previous background color
-                    markup_parts.append("[/]")
-                markup_parts.append(f"[{color_name}]")
-                current_bg[0] = color_name
-            elif code == "38" and i + 2 < len(codes) and codes[i + 1] == "5":  # 256-color fg
-                color_num = codes[i + 2]
-                if color_num.isdigit() and 0 <= int(color_num) <= 255:
-                    if current_fg[0]:
-                        markup_parts.append("[/]")
-                    markup_parts.append(f"[color({color_num})]")
-                    current_fg[0] = f"color({color_num})"
-                i += 2  # Skip the next two codes
-            elif code == "48" and i + 2 < len(codes) and codes[i + 1] == "5":  # 256-color bg
-                color_num = codes[i + 2]
-                if color_num.isdigit() and 0 <= int(color_num) <= 255:
-                    if current_bg[0]:
-                        markup_parts.append("[/]")
-                    markup_parts.append(f"[on color({color_num})]")
-                    current_bg[0] = f"on color({color_num})"
-                i += 2  # Skip the next two codes
+    # Add remaining text
+    pending_text += text[last_end:]
+    if pending_text:
+        result_parts.append(_escape_text(pending_text))
 
-            i += 1
+    # Close any remaining open tags
+    closing_tags = []
+    if current_fg:
+        closing_tags.append("[/]")
+    if current_bg:
+        closing_tags.append("[/]")
+    for _ in current_styles:
+        closing_tags.append("[/]")
 
-        return "".join(markup_parts)
+    result_parts.extend(closing_tags)
 
-    def _convert_with_state_tracking(self, text: str) -> str:
-        """Convert ANSI sequences with proper state tracking for consecutive colors.
+    return "".join(result_parts)
 
-        Args:
-            text: Text with escaped brackets containing ANSI sequences
 
-        Returns:
-            Text with ANSI codes converted to Rich markup with proper state management
-        """
-        # Pattern to match ANSI escape sequences
-        ansi_pattern = re.compile(r"\033\[([0-9;]*)m")
+def _convert(text: str) -> str:
+    """Convert ANSI escape sequences to Rich markup and escape literal brackets.
 
-        # Track current state using mutable objects
-        current_fg: list[str | None] = [None]  # Use list to make it mutable
-        current_bg: list[str | None] = [None]  # Use list to make it mutable
-        current_styles: set[str] = set()
+    Args:
+        text: Text containing ANSI escape sequences and literal brackets
 
-        # Process text with state tracking
-        result_parts: list[str] = []
-        last_end = 0
+    Returns:
+        Text with ANSI codes converted to Rich markup and literal brackets escaped
+    """
+    # Fast path: without an ESC byte there is nothing to convert, only brackets to escape
+    if "\033" not in text:
+        return escape(text)
 
-        for match in ansi_pattern.finditer(text):
-            # Add text before ANSI sequence
-            before_text = text[last_end : match.start()]
-            if before_text:
-                result_parts.append(before_text)
+    # Process with state tracking; brackets are escaped per slice during the scan
+    return _convert_with_state_tracking(text)
 
-            # Convert ANSI sequence with state management
-            ansi_codes = match.group(1)
-            if ansi_codes:  # Skip empty sequences
-                markup = self._convert_ansi_codes_with_state(
-                    ansi_codes, current_fg, current_bg, current_styles
-                )
-                if markup:
-                    result_parts.append(markup)
 
-            last_end = match.end()
+@functools.lru_cache(maxsize=CONVERT_CACHE_SIZE)
+def _convert_cached(text: str) -> str:
+    """Memoized _convert for short, frequently repeated lines (e.g. yt-dlp status prefixes)."""
+    return _convert(text)
 
-        # Add remaining text
-        remaining = text[last_end:]
-        if remaining:
-            result_parts.append(remaining)
 
-        # Close any remaining open tags
-        closing_tags = []
-        if current_fg[0]:
-            closing_tags.append("[/]")
-        if current_bg[0]:
-            closing_tags.append("[/]")
-        for _ in current_styles:
-            closing_tags.append("[/]")
+class ANSIConverter:
+    """Converts ANSI escape sequences to Rich markup for proper color rendering."""
 
-        result_parts.extend(closing_tags)
+    color_map = COLOR_MAP
+    bg_map = BG_MAP
+    style_map = STYLE_MAP
 
-        return "".join(result_parts)
+    @staticmethod
+    def convert(text: str) -> str:
+        """Convert ANSI escape sequences to Rich markup and escape literal brackets.
 
-    def _convert_ansi_codes(self, codes_str: str) -> str:
-        """Convert ANSI code string to Rich markup (without state management).
+        Short inputs are served from a bounded cache since yt-dlp repeats the same
+        colored fragments many times; longer, mostly unique lines bypass it.
 
         Args:
-            codes_str: ANSI codes separated by semicolons (e.g., "0;32;1")
+            text: Text containing ANSI escape sequences and literal brackets
 
         Returns:
-            Rich markup string
+            Text with ANSI codes converted to Rich markup and literal brackets escaped
         """
-        # Create dummy state variables for compatibility
-        current_fg = [None]
-        current_bg = [None]
-        current_styles: set[str] = set()
+        if len(text) <= CONVERT_CACHE_MAX_LENGTH:
+            return _convert_cached(text)
+        return _convert(text)
+
+    @staticmethod
+    def strip_ansi(text: str) -> str:
+        """Remove ANSI color/style sequences, returning plain text without Rich markup.
+
+        Args:
+            text: Text containing ANSI escape sequences
+
+        Returns:
+            Text with ANSI color/style sequences removed and brackets left untouched
+        """
+        if "\033" not in text:
+            return text
+
+        plain_parts: list[str] = []
+        last_end = 0
+        while True:
+            start, end = _find_sgr_sequence(text, last_end)
+            if start < 0:
+                break
+            if start > last_end:
+                plain_parts.append(text[last_end:start])
+            last_end = end + 1
 
-        return self._convert_ansi_codes_with_state(
-            codes_str, current_fg, current_bg, current_styles
-        )
+        plain_parts.append(text[last_end:])
+        return "".join(plain_parts)
 
 
 # Convenience function for easy usage
@@ -270,5 +338,4 @@ def ansi_to_rich(text: str) -> str:
     Returns:
         Text with ANSI codes converted to Rich markup
     """
-    converter = ANSIConverter()
-    return converter.convert(text)
+    return ANSIConverter.convert(text)
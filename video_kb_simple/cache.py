@@ -0,0 +1,67 @@
+"""On-disk cache of extracted playlist details for video-kb-simple."""
+
+import gzip
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from .models import PlaylistDetails, PlaylistType
+from .utils import DEFAULT_CACHE_DIR, DEFAULT_CACHE_TTL
+
+CACHE_FILE_SUFFIX = ".json.gz"
+
+
+class PlaylistCache:
+    """Stores PlaylistDetails as gzipped JSON so repeat runs skip playlist extraction."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, ttl_seconds: float = DEFAULT_CACHE_TTL):
+        """Initialize the playlist cache.
+
+        Args:
+            cache_dir: Directory holding the cache files (created on first write)
+            ttl_seconds: Age in seconds after which an entry is treated as missing
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    def _entry_path(self, url: str, playlist_type: PlaylistType) -> Path:
+        """Return the cache file path for a normalized playlist URL."""
+        key = hashlib.sha256(f"{playlist_type.value}:{url}".encode()).hexdigest()
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, url: str, playlist_type: PlaylistType) -> PlaylistDetails | None:
+        """Return cached playlist details, or None if missing, expired or unreadable."""
+        entry_path = self._entry_path(url, playlist_type)
+        try:
+            if time.time() - entry_path.stat().st_mtime > self.ttl_seconds:
+                return None
+            with gzip.open(entry_path, "rb") as f:
+                return PlaylistDetails.model_validate_json(f.read())
+        except (OSError, EOFError, ValidationError):
+            return None
+
+    def set(self, url: str, playlist_type: PlaylistType, playlist_details: PlaylistDetails) -> None:
+        """Store playlist details under a normalized playlist URL and type.
+
+        The entry is written to a temporary file and moved into place so concurrent
+        runs never read a partially written entry.
+        """
+        entry_path = self._entry_path(url, playlist_type)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(gzip.compress(playlist_details.model_dump_json().encode()))
+        temp_path.replace(entry_path)
+
+    def clear(self) -> int:
+        """Delete all cache entries and return how many were removed."""
+        if not self.cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for entry_path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            entry_path.unlink(missing_ok=True)
+            removed += 1
+        return removed
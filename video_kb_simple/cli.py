@@ -1,57 +1,82 @@
 """CLI interface for video-kb-simple."""
 
+import contextlib
 import logging
+import os
 import signal
-from collections.abc import Callable
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from enum import StrEnum
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich import print as rprint
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.markup import escape
 
 from video_kb_simple import __version__
-from video_kb_simple.downloader import PlaylistResult, SimpleDownloader
+from video_kb_simple.utils import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_TTL,
+    MAX_CONCURRENCY,
+    unique_preserve,
+)
+
+if TYPE_CHECKING:
+    from video_kb_simple.models import PlaylistResult, VideoResult
 
 # Constants
 MAX_FILES_TO_SHOW_INDIVIDUALLY = 10
 MAX_WARNINGS_ERRORS_TO_SHOW = 5
 MAX_FILES_TO_SHOW_BEFORE_SUMMARY = 3
 DEFAULT_LANGUAGE = "en"
+MAX_PROGRESS_TITLE_LENGTH = 40
+
+
+class OutputFormat(StrEnum):
+    """Output formats of the download command."""
+
+    HUMAN = "human"
+    JSON = "json"
+    NDJSON = "ndjson"
+
 
 app = typer.Typer(
     name="video-kb",
     help="Extract transcribed text from videos using yt-dlp",
     rich_markup_mode="rich",
 )
+cache_app = typer.Typer(help="Manage the playlist metadata cache")
+app.add_typer(cache_app, name="cache")
 console = Console()
 
 
 def create_signal_handler(console: Console) -> Callable[[], bool]:
-    """Create a signal handler that uses the provided console for output."""
-    shutdown_requested = False
-    signal_count = 0
+    """Create a signal handler that uses the provided console for output.
 
-    def signal_handler(_signum: int, _frame) -> None:  # type: ignore[no-untyped-def]
-        nonlocal shutdown_requested, signal_count
-        signal_count += 1
+    The shutdown flag is a threading.Event, so download worker threads polling the
+    returned check see a request made by the signal handler on the main thread.
+    """
+    shutdown_requested = threading.Event()
 
-        if signal_count == 1:
+    def signal_handler(_signum: int, _frame) -> None:  # type: ignore[no-untyped-def]
+        if not shutdown_requested.is_set():
             # First signal - request graceful shutdown
-            shutdown_requested = True
+            shutdown_requested.set()
             console.print(
                 "\n[yellow]Shutdown requested. Finishing current download and exiting gracefully...[/yellow]"
             )
             console.print("[dim]Press Ctrl+C again to force immediate exit.[/dim]")
         else:
-            # Second signal - force immediate exit
+            # Second signal - force immediate exit. os._exit skips interpreter shutdown,
+            # which would otherwise wait for busy download worker threads to finish.
+            # It also skips Live.stop(), so restore the cursor the progress bar hid.
             console.print("\n[red]Force exiting immediately...[/red]")
-            exit(1)
-
-    def is_shutdown_requested() -> bool:
-        return shutdown_requested
+            console.show_cursor(True)
+            console.file.flush()
+            os._exit(1)
 
     def setup_signals() -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -61,7 +86,22 @@ def create_signal_handler(console: Console) -> Callable[[], bool]:
     # Set up the signals
     setup_signals()
 
-    return is_shutdown_requested
+    return shutdown_requested.is_set
+
+
+def _parse_languages(raw_languages: Iterable[str]) -> list[str]:
+    """Split --lang values on commas into unique, non-empty language codes in order.
+
+    Codes are kept as given (not lowercased): yt-dlp matches them case-sensitively
+    as regexes against names such as "zh-Hans" or "pt-BR".
+    """
+    # Most values hold a single code; skip building a one-element split() list for them
+    codes = (
+        code.strip()
+        for raw_language in raw_languages
+        for code in (raw_language.split(",") if "," in raw_language else (raw_language,))
+    )
+    return unique_preserve(code for code in codes if code)
 
 
 def version_callback(value: bool) -> None:
@@ -103,19 +143,76 @@ def download(
             "--max-videos", help="Maximum number of videos to process from playlist/channel"
         ),
     ] = None,
+    max_languages: Annotated[
+        int | None,
+        typer.Option(
+            "--max-languages",
+            min=1,
+            help="Download at most this many of the --lang languages (each one is a separate "
+            "subtitle request per video)",
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            "-j",
+            min=1,
+            max=MAX_CONCURRENCY,
+            help="Number of playlist videos to download in parallel",
+        ),
+    ] = 1,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir",
+            help="Directory for cached playlist details and yt-dlp data (default: "
+            f"{DEFAULT_CACHE_DIR} for playlist details; yt-dlp keeps its own cache location)",
+            show_default=False,
+        ),
+    ] = None,
+    cache_ttl: Annotated[
+        int,
+        typer.Option(
+            "--cache-ttl",
+            min=0,
+            help="Seconds to reuse cached playlist details (0 disables the cache)",
+        ),
+    ] = DEFAULT_CACHE_TTL,
+    refresh_cache: Annotated[
+        bool,
+        typer.Option(
+            "--refresh",
+            help="Re-fetch the playlist/channel video list instead of using the cache "
+            "(existing transcripts are still skipped)",
+        ),
+    ] = False,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            help="Output format: human-readable summary, one JSON result, or one JSON "
+            "line per video",
+        ),
+    ] = OutputFormat.HUMAN,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose output")] = False,
     debug: Annotated[bool, typer.Option("--debug", help="Enable yt-dlp debug output")] = False,
 ) -> None:
     """Download transcripts from a single video, playlist, or channel."""
-    output_dir.mkdir(exist_ok=True)
+    # Imported here so `--version`, `--help` and `cache` never load yt-dlp
+    from rich.panel import Panel
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
 
-    # Process language options: handle comma-separated values and remove duplicates
-    if languages:
-        selected_languages = list(
-            dict.fromkeys(lang.strip() for language in languages for lang in language.split(","))
-        )
-    else:
-        selected_languages = [DEFAULT_LANGUAGE]
+    from video_kb_simple.downloader import SimpleDownloader
+
+    output_dir.mkdir(exist_ok=True)
 
     # Set log level based on flags
     if debug:
@@ -125,45 +222,124 @@ def download(
     else:
         log_level = logging.WARNING
 
-    if verbose:
-        console.print(f"[green]Downloading transcripts from:[/green] {url}")
-        console.print(f"[green]Output directory:[/green] {output_dir}")
-        console.print(
-            "[yellow]Note: Using conservative rate limiting to avoid bot detection[/yellow]"
-        )
-        if browser_cookies:
-            console.print(f"[green]Using cookies from:[/green] {browser_cookies}")
-        console.print(f"[green]Languages:[/green] {', '.join(selected_languages)}")
-
-    try:
-        # Create signal handler for graceful shutdown
-        shutdown_check = create_signal_handler(console)
-
-        downloader = SimpleDownloader(
-            output_dir=output_dir,
-            log_level=log_level,
-            force_download=force_download,
-            browser_for_cookies=browser_cookies,
-            shutdown_check=shutdown_check,
-        )
+    # JSON output goes to the real stdout; everything rendered by Rich (logs, verbose notes,
+    # error panels) is sent to stderr so the stream stays machine-readable
+    json_stream = sys.stdout
+    machine_output = output_format is not OutputFormat.HUMAN
+    streamed_results = 0
 
-        result = downloader.download_transcripts(
-            url=url,
-            max_videos=max_videos,
-            subtitle_languages=selected_languages,
-        )
+    with contextlib.ExitStack() as output_redirect:
+        if machine_output:
+            output_redirect.enter_context(contextlib.redirect_stdout(sys.stderr))
 
-        # Display results
-        _display_batch_results(result, console)
+        selected_languages = _parse_languages(languages or ())
+        if max_languages is not None and len(selected_languages) > max_languages:
+            console.print(
+                f"[yellow]Only the first {max_languages} of {len(selected_languages)} languages "
+                "will be downloaded (--max-languages)[/yellow]"
+            )
+            del selected_languages[max_languages:]
+        selected_languages = selected_languages or [DEFAULT_LANGUAGE]
 
-    except Exception as error:
-        error_display_panel = Panel(
-            f"❌ Error: {error!s}",
-            title="Playlist Download Failed",
-            style="red",
-        )
-        console.print(error_display_panel)
-        raise typer.Exit(1) from error
+        if verbose:
+            console.print(f"[green]Downloading transcripts from:[/green] {url}")
+            console.print(f"[green]Output directory:[/green] {output_dir}")
+            console.print(
+                "[yellow]Note: Using conservative rate limiting to avoid bot detection[/yellow]"
+            )
+            if browser_cookies:
+                console.print(f"[green]Using cookies from:[/green] {browser_cookies}")
+            console.print(f"[green]Languages:[/green] {', '.join(selected_languages)}")
+            if concurrency > 1:
+                console.print(f"[green]Parallel downloads:[/green] {concurrency}")
+
+        try:
+            # Create signal handler for graceful shutdown
+            shutdown_check = create_signal_handler(console)
+
+            # Show a live progress bar while playlist videos download; verbose mode logs each
+            # video instead. Transient, so only the final summary remains on screen.
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+                transient=True,
+                disable=verbose or debug or machine_output,
+            ) as progress:
+                # Neutral until the downloader reports a playlist's video count; single
+                # videos keep it for the whole download
+                task_id = progress.add_task("Downloading transcripts...", total=None)
+
+                def show_progress(
+                    completed: int, total: int, video_result: "VideoResult | None"
+                ) -> None:
+                    nonlocal streamed_results
+                    if video_result is None:
+                        progress.update(
+                            task_id, total=total, description=f"Downloading {total} videos..."
+                        )
+                        return
+                    if output_format is OutputFormat.NDJSON:
+                        typer.echo(video_result.model_dump_json(), file=json_stream)
+                        streamed_results += 1
+                    title = video_result.title or video_result.url or "Unknown"
+                    progress.update(
+                        task_id,
+                        completed=completed,
+                        total=total,
+                        description=f"{_status_icon(video_result)} "
+                        f"{escape(title[:MAX_PROGRESS_TITLE_LENGTH])}",
+                    )
+
+                downloader = SimpleDownloader(
+                    output_dir=output_dir,
+                    log_level=log_level,
+                    force_download=force_download,
+                    browser_for_cookies=browser_cookies,
+                    shutdown_check=shutdown_check,
+                    concurrency=concurrency,
+                    cache_dir=cache_dir or DEFAULT_CACHE_DIR,
+                    cache_ttl=cache_ttl,
+                    progress_callback=show_progress,
+                    refresh_cache=refresh_cache,
+                    # yt-dlp's cache only moves when the user picked a directory
+                    ytdlp_cache_dir=cache_dir,
+                )
+
+                result = downloader.download_transcripts(
+                    url=url,
+                    max_videos=max_videos,
+                    subtitle_languages=selected_languages,
+                )
+
+            # Display results
+            if output_format is OutputFormat.JSON:
+                typer.echo(result.model_dump_json(), file=json_stream)
+            elif output_format is OutputFormat.NDJSON:
+                # Single videos never reach the playlist progress callback
+                for video_result in result.video_results[streamed_results:]:
+                    typer.echo(video_result.model_dump_json(), file=json_stream)
+            else:
+                _display_batch_results(result, console, compact=not verbose)
+
+        except Exception as error:
+            error_display_panel = Panel(
+                f"❌ Error: {error!s}",
+                title="Playlist Download Failed",
+                style="red",
+            )
+            console.print(error_display_panel)
+            raise typer.Exit(1) from error
+
+
+def _status_icon(video_result: "VideoResult") -> str:
+    """Return the icon for a video's download status."""
+    if video_result.is_fail:
+        return "❌"
+    return "✅" if video_result.is_full_success else "⚠️"
 
 
 def _display_items(items: list[str], label: str, console: Console, color: str = "yellow") -> None:
@@ -186,8 +362,54 @@ def _display_items(items: list[str], label: str, console: Console, color: str =
         console.print(f"  ... and {len(items) - MAX_WARNINGS_ERRORS_TO_SHOW} more {label.lower()}")
 
 
-def _display_batch_results(result: PlaylistResult, console: Console) -> None:
-    """Display playlist download results in a formatted table."""
+def _display_compact_result(result: "PlaylistResult", console: Console) -> None:
+    """Display a single error-free video result as one summary line plus any warnings.
+
+    Args:
+        result: Download result holding exactly one video result
+        console: Rich console for output
+    """
+    video_result = result.video_results[0]
+    title = video_result.title or (
+        result.playlist_details.title if result.playlist_details else None
+    )
+    file_paths = [downloaded_file.path for downloaded_file in video_result.downloaded_files]
+    location = f" to [bold blue]{file_paths[0].parent}[/bold blue]" if file_paths else ""
+
+    console.print(
+        f"{_status_icon(video_result)} [bold]Download Summary:[/bold] {escape(title or 'Unknown')} - "
+        f"{len(file_paths)} files{location} ({result.processing_time_seconds:.1f}s)"
+    )
+    _display_items(video_result.warnings, "Warnings", console, "yellow")
+
+
+def _display_batch_results(
+    result: "PlaylistResult", console: Console, compact: bool = False
+) -> None:
+    """Display playlist download results in a formatted table.
+
+    Args:
+        result: Download result to display
+        console: Rich console for output
+        compact: Print a single summary line instead of the table when the URL was a
+            single video and it finished without errors
+    """
+    from video_kb_simple.models import PlaylistType
+
+    if (
+        compact
+        and result.playlist_details is not None
+        and result.playlist_details.playlist_type is PlaylistType.SINGLE_VIDEO
+        and len(result.video_results) == 1
+        and not result.errors
+    ):
+        _display_compact_result(result, console)
+        return
+
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Create summary table
     table = Table(title="Download Summary")
     table.add_column("Metric", style="cyan")
@@ -204,71 +426,66 @@ def _display_batch_results(result: PlaylistResult, console: Console) -> None:
 
     table.add_row("Total videos requested", str(result.total_requested))
 
-    table.add_row(":white_check_mark: Success", f"[green]{result.success_downloads}[/green]")
-    table.add_row(
-        ":yellow_circle: Partial success", f"[yellow]{result.partial_success_downloads}[/yellow]"
-    )
-    table.add_row(":cross_mark: Failed", f"[red]{result.fail_downloads}[/red]")
+    success_count, partial_success_count, fail_count = result.status_counts
+    table.add_row(":white_check_mark: Success", f"[green]{success_count}[/green]")
+    table.add_row(":yellow_circle: Partial success", f"[yellow]{partial_success_count}[/yellow]")
+    table.add_row(":cross_mark: Failed", f"[red]{fail_count}[/red]")
 
     table.add_row("Processing time", f"{result.processing_time_seconds:.1f}s")
 
-    # Calculate language-specific download counts and add to table
-    total_successful = result.success_downloads + result.partial_success_downloads
+    # Collect per-language counts, listed files and warnings in one pass over the videos
+    downloads_by_lang: dict[str, int] = {}
+    downloaded_files: list[Path] = []
+    all_warnings: list[str] = []
+    for video_result in result.video_results:
+        all_warnings.extend(video_result.warnings)
+        is_full_success = video_result.is_full_success
+        if not (is_full_success or video_result.is_partial_success):
+            continue
+        for downloaded_file in video_result.downloaded_files:
+            if downloaded_file.language:
+                downloads_by_lang[downloaded_file.language] = (
+                    downloads_by_lang.get(downloaded_file.language, 0) + 1
+                )
+            if is_full_success:
+                downloaded_files.append(downloaded_file.path)
+
+    # Add the success total and language breakdown to the table
+    total_successful = success_count + partial_success_count
     if total_successful > 0:
         table.add_row("Total successful downloads", f"[green]{total_successful}[/green]")
-
-        # Count downloads by language
-        downloads_by_lang: dict[str, int] = {}
-        for video_result in result.video_results:
-            if video_result.is_full_success or video_result.is_partial_success:
-                for downloaded_file in video_result.downloaded_files:
-                    if downloaded_file.language:
-                        downloads_by_lang[downloaded_file.language] = (
-                            downloads_by_lang.get(downloaded_file.language, 0) + 1
-                        )
-
-        if downloads_by_lang:
-            # Add language breakdown rows to the table
-            for lang, count in sorted(downloads_by_lang.items()):
-                table.add_row(f"  └─ {lang} downloads", f"[blue]{count}[/blue]")
+        # Pre-styled Text cells skip Rich's markup parser, which otherwise runs per row
+        for lang, count in sorted(downloads_by_lang.items()):
+            table.add_row(f"  └─ {lang} downloads", Text(str(count), style="blue"))
 
     console.print(table)
 
     # Show downloaded files
-    downloaded_files = []
-    for video_result in result.video_results:
-        if video_result.is_full_success:
-            for downloaded_file in video_result.downloaded_files:
-                downloaded_files.append(downloaded_file.path)
-
     if downloaded_files:
         console.print(
             f"\n[green]Downloaded {len(downloaded_files)} files to:[/green] {downloaded_files[0].parent}"
         )
 
+        # Build the listing first and print it in one call (one render pass)
         if len(downloaded_files) <= MAX_FILES_TO_SHOW_INDIVIDUALLY:
             # Show all files if threshold or fewer
-            for file_path in downloaded_files:
-                console.print(f"  📄 {file_path.name}")
+            file_lines = [f"  📄 {file_path.name}" for file_path in downloaded_files]
         else:
             # Show first few and summarize
-            for file_path in downloaded_files[:MAX_FILES_TO_SHOW_BEFORE_SUMMARY]:
-                console.print(f"  📄 {file_path.name}")
-            console.print(
+            file_lines = [
+                f"  📄 {file_path.name}"
+                for file_path in downloaded_files[:MAX_FILES_TO_SHOW_BEFORE_SUMMARY]
+            ]
+            file_lines.append(
                 f"  ... and {len(downloaded_files) - MAX_FILES_TO_SHOW_BEFORE_SUMMARY} more files"
             )
+        console.print("\n".join(file_lines))
 
     # Show warnings and errors
-    all_warnings = []
-    for video_result in result.video_results:
-        if video_result.warnings:
-            all_warnings.extend(video_result.warnings)
-
     _display_items(all_warnings, "Warnings", console, "yellow")
     _display_items(result.errors, "Errors", console, "red")
 
     # Show final success panel
-    total_successful = result.success_downloads + result.partial_success_downloads
     if total_successful > 0:
         success_display_panel = Panel(
             f"✅ Successfully downloaded transcripts from {total_successful} videos\n"
@@ -279,6 +496,19 @@ def _display_batch_results(result: PlaylistResult, console: Console) -> None:
         console.print(success_display_panel)
 
 
+@cache_app.command("clear")
+def cache_clear(
+    cache_dir: Annotated[
+        Path, typer.Option("--cache-dir", help="Cache directory to clear")
+    ] = DEFAULT_CACHE_DIR,
+) -> None:
+    """Delete all cached playlist details."""
+    from video_kb_simple.cache import PlaylistCache
+
+    removed = PlaylistCache(cache_dir).clear()
+    console.print(f"[green]Removed {removed} cached playlist entries from[/green] {cache_dir}")
+
+
 @app.callback()
 def main(
     version: Annotated[
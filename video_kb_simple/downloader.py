@@ -4,10 +4,12 @@ import json
 import logging
 import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from rich.console import Console
 
+from .cache import PlaylistCache
 from .logger import Logger
 from .models import (
     PlaylistDetails,
@@ -16,14 +18,20 @@ from .models import (
     VideoResult,
 )
 from .utils import (
+    DEFAULT_CACHE_TTL,
     FILE_TYPE_METADATA,
     FILE_TYPE_SUBTITLE,
+    MAX_CONCURRENCY,
     extract_video_id_from_url,
     normalize_languages,
     normalize_playlist_url,
 )
 from .ytdlp_handler import YTDLPHandler
 
+# Seconds the main thread blocks between checks while parallel downloads run. A bounded
+# wait keeps it responsive to signals, which may be delivered to a worker thread.
+WORKER_POLL_INTERVAL = 0.2
+
 
 class SimpleDownloader:
     """Simplified video downloader that focuses on core functionality."""
@@ -35,6 +43,12 @@ class SimpleDownloader:
         force_download: bool = False,
         browser_for_cookies: str | None = None,
         shutdown_check: Callable[[], bool] | None = None,
+        concurrency: int = 1,
+        cache_dir: Path | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        progress_callback: Callable[[int, int, VideoResult | None], None] | None = None,
+        refresh_cache: bool = False,
+        ytdlp_cache_dir: Path | None = None,
     ):
         """Initialize the simple downloader.
 
@@ -44,12 +58,28 @@ class SimpleDownloader:
             force_download: Re-download transcripts even if they already exist
             browser_for_cookies: Browser to extract cookies from (e.g. 'firefox', 'chrome')
             shutdown_check: Optional callback to check if shutdown was requested
+            concurrency: Number of playlist videos to download in parallel
+                (clamped to 1..MAX_CONCURRENCY)
+            cache_dir: Directory for cached playlist details (None disables the playlist cache)
+            cache_ttl: Seconds a cached playlist stays valid
+            progress_callback: Optional callback invoked as (completed, total, video_result)
+                after each playlist video finishes, and once as (0, total, None) when the
+                playlist's video list is known
+            refresh_cache: Re-extract playlist details instead of using the cached ones
+                (existing transcripts are still skipped)
+            ytdlp_cache_dir: Directory for yt-dlp's own cache (None keeps yt-dlp's default)
         """
         self.output_dir = output_dir
         self.log_level = log_level
         self.force_download = force_download
         self.browser_for_cookies = browser_for_cookies
         self.shutdown_check = shutdown_check
+        self.progress_callback = progress_callback
+        self.refresh_cache = refresh_cache
+        self.concurrency = min(max(concurrency, 1), MAX_CONCURRENCY)
+        self.playlist_cache = (
+            PlaylistCache(cache_dir, cache_ttl) if cache_dir is not None and cache_ttl > 0 else None
+        )
 
         console = Console()
         self.logger = Logger(console, log_level)
@@ -61,6 +91,7 @@ class SimpleDownloader:
             log_level=log_level,
             browser_for_cookies=browser_for_cookies,
             shutdown_check=shutdown_check,
+            cache_dir=ytdlp_cache_dir,
         )
 
     def _is_shutdown_requested(self) -> bool:
@@ -77,6 +108,20 @@ class SimpleDownloader:
                 return False
         return False
 
+    def _report_progress(
+        self, completed: int, total: int, video_result: VideoResult | None
+    ) -> None:
+        """Pass a finished video (or None before the first one) to the progress callback.
+
+        Failures in the callback are logged and otherwise ignored so a display
+        problem never aborts the downloads.
+        """
+        if self.progress_callback is not None:
+            try:
+                self.progress_callback(completed, total, video_result)
+            except Exception as e:
+                self.logger.debug(f"Progress callback failed: {e}")
+
     def download_transcripts(
         self, url: str, max_videos: int | None = None, subtitle_languages: list[str] | None = None
     ) -> PlaylistResult:
@@ -101,7 +146,7 @@ class SimpleDownloader:
         Raises:
             URLNormalizationError: If URL cannot be parsed or normalized
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         subtitle_languages = normalize_languages(subtitle_languages)
 
         self.logger.info(f"Starting download from: {url}")
@@ -113,53 +158,78 @@ class SimpleDownloader:
         self.logger.info(f"Detected type: {playlist_type.value}")
         if playlist_type == PlaylistType.SINGLE_VIDEO:
             video_result = self._download_video_transcripts(url, subtitle_languages)
-            playlist_result = self._wrap_single_video_result(video_result, url, start_time)
+            playlist_result = self._wrap_single_video_result(video_result, url)
         else:
-            playlist_details = self.ytdlp_handler._extract_playlist_details(
-                normalized_url, playlist_type
-            )
+            playlist_details = self._get_playlist_details(normalized_url, playlist_type)
             if playlist_details is None:
                 # Failed to extract playlist details, create a failed result
                 playlist_result = PlaylistResult(
                     playlist_details=None,
                     video_results=[],
                     total_requested=0,
-                    processing_time_seconds=time.time() - start_time,
                 )
             else:
                 playlist_result = self._download_playlist_transcripts(
                     playlist_details, max_videos, subtitle_languages
                 )
-                playlist_result.processing_time_seconds = time.time() - start_time
+
+        # Monotonic clock: elapsed time is unaffected by wall-clock adjustments
+        playlist_result.processing_time_seconds = time.monotonic() - start_time
+
+        success_count, partial_success_count, fail_count = playlist_result.status_counts
+        successful_count = success_count + partial_success_count
 
         # Check if shutdown was requested during processing
         if self._is_shutdown_requested():
             self.logger.warning("Download was interrupted by user request.")
-            successful_count = (
-                playlist_result.success_downloads + playlist_result.partial_success_downloads
-            )
-            self.logger.info(
-                f"Partial results: {successful_count} successful, {playlist_result.fail_downloads} failed"
-            )
+            self.logger.info(f"Partial results: {successful_count} successful, {fail_count} failed")
         else:
-            successful_count = (
-                playlist_result.success_downloads + playlist_result.partial_success_downloads
-            )
-            self.logger.success(
-                f"Success: {successful_count}, Failed: {playlist_result.fail_downloads}"
-            )
+            self.logger.success(f"Success: {successful_count}, Failed: {fail_count}")
 
         return playlist_result
 
-    def _wrap_single_video_result(
-        self, video_result: VideoResult, url: str, start_time: float
-    ) -> PlaylistResult:
+    def _get_playlist_details(
+        self, normalized_url: str, playlist_type: PlaylistType
+    ) -> PlaylistDetails | None:
+        """Return playlist details from the cache, extracting and caching them on a miss.
+
+        Playlist extraction is the slowest step of a repeat run, so fresh cached details
+        are reused unless refresh_cache or force_download is set. Either way the
+        newly extracted details replace the cached entry.
+
+        Args:
+            normalized_url: Normalized playlist or channel URL
+            playlist_type: Detected playlist type
+
+        Returns:
+            PlaylistDetails, or None if extraction failed
+        """
+        if self.playlist_cache is not None and not (self.refresh_cache or self.force_download):
+            cached_details = self.playlist_cache.get(normalized_url, playlist_type)
+            if cached_details is not None:
+                self.logger.info(
+                    f"Using cached playlist details ({len(cached_details.video_urls)} videos)"
+                )
+                return cached_details
+
+        playlist_details = self.ytdlp_handler._extract_playlist_details(
+            normalized_url, playlist_type
+        )
+
+        if playlist_details is not None and self.playlist_cache is not None:
+            try:
+                self.playlist_cache.set(normalized_url, playlist_type, playlist_details)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache playlist details: {e}")
+
+        return playlist_details
+
+    def _wrap_single_video_result(self, video_result: VideoResult, url: str) -> PlaylistResult:
         """Wrap a single video result in a playlist structure for consistent interface.
 
         Args:
             video_result: Result from single video download
             url: Original video URL
-            start_time: When download started
 
         Returns:
             PlaylistResult with single video wrapped as playlist
@@ -177,7 +247,6 @@ class SimpleDownloader:
             playlist_details=playlist_details,
             video_results=[video_result],
             total_requested=1,
-            processing_time_seconds=time.time() - start_time,
         )
 
         return playlist_result
@@ -186,12 +255,15 @@ class SimpleDownloader:
         self,
         video_url: str,
         subtitle_languages: list[str] | None = None,
+        file_index: dict[str, list[Path]] | None = None,
     ) -> VideoResult:
         """Download transcripts for a single video.
 
         Args:
             video_url: YouTube video URL
             subtitle_languages: List of language codes to download
+            file_index: Output directory files grouped by video ID, scanned once per
+                playlist; when given, replaces the per-video directory glob
 
         Returns:
             VideoResult with download status and any files downloaded
@@ -210,8 +282,12 @@ class SimpleDownloader:
             )
 
         # Check for existing download first
-        existing_files = self.ytdlp_handler._scan_downloaded_files(video_id)
-        if existing_files and not self.force_download:
+        existing_files = (
+            self.ytdlp_handler._scan_downloaded_files(video_id, file_index)
+            if not self.force_download
+            else []
+        )
+        if existing_files:
             # Check which languages are already downloaded
             downloaded_languages = set()
             metadata_file = None
@@ -228,8 +304,8 @@ class SimpleDownloader:
             if not remaining_languages and metadata_file:
                 # All requested languages are already downloaded
                 try:
-                    with open(metadata_file.path, encoding="utf-8") as f:
-                        metadata = json.load(f)
+                    # json.loads decodes the UTF-8 bytes itself, skipping the text layer
+                    metadata = json.loads(metadata_file.path.read_bytes())
                     title = metadata.get("title", "Unknown Title")
                     upload_date = metadata.get("upload_date")
                     actual_video_id = metadata.get("id", video_id)
@@ -245,7 +321,7 @@ class SimpleDownloader:
                         errors=[],
                         downloaded_files=existing_files,
                     )
-                except (json.JSONDecodeError, OSError, KeyError) as e:
+                except (json.JSONDecodeError, UnicodeDecodeError, OSError, KeyError) as e:
                     self.logger.warning(f"Failed to load metadata from {metadata_file.path}: {e}")
 
             # Update languages to only download missing ones
@@ -280,64 +356,186 @@ class SimpleDownloader:
         self.logger.info(f"Languages: {subtitle_languages}")
         self.logger.info(f"Output directory: {self.output_dir}")
 
-        videos_to_process = playlist.video_urls
+        videos_to_process = self._dedupe_video_urls(playlist.video_urls)
         if max_videos and max_videos > 0:
             videos_to_process = videos_to_process[:max_videos]
 
         total_videos = len(videos_to_process)
         self.logger.info(f"Processing {total_videos} videos...")
+        self._report_progress(0, total_videos, None)
 
-        video_results = []
-        successful_downloads = 0
-        failed_downloads = 0
-        errors = []
+        # One directory scan up front instead of one glob per video
+        file_index = None if self.force_download else self.ytdlp_handler._index_downloaded_files()
 
-        for i, video_url in enumerate(videos_to_process, 1):
-            # Check for shutdown signal before processing each video
-            if self._is_shutdown_requested():
-                self.logger.warning(
-                    f"Shutdown requested. Stopping after processing {i - 1}/{total_videos} videos."
+        if self.concurrency > 1 and total_videos > 1:
+            video_results = self._download_videos_concurrently(
+                videos_to_process, subtitle_languages, file_index
+            )
+        else:
+            video_results = []
+            for i, video_url in enumerate(videos_to_process, 1):
+                video_result = self._download_playlist_video(
+                    i, total_videos, video_url, subtitle_languages, file_index
                 )
-                break
-
-            self.logger.info(f"Processing video {i}/{total_videos}: {video_url}")
-
-            try:
-                video_result = self._download_video_transcripts(video_url, subtitle_languages)
-                video_results.append(video_result)
+                if video_result is None:
+                    self.logger.warning(
+                        f"Shutdown requested. Stopping after processing {i - 1}/{total_videos} videos."
+                    )
+                    break
 
-                if video_result.is_full_success:
-                    successful_downloads += 1
-                else:
-                    failed_downloads += 1
-                    if video_result.errors:
-                        errors.extend([f"Video {i}: {error}" for error in video_result.errors])
-                    else:
-                        errors.append(f"Video {i}: Unknown error")
-
-            except Exception as error:
-                error_message = f"Unexpected error processing video {i}: {error}"
-                self.logger.error(error_message)
-                errors.append(error_message)
-                failed_downloads += 1
-
-                video_result = VideoResult(
-                    video_id=None,
-                    title=None,
-                    url=video_url,
-                    warnings=[],
-                    errors=[error_message],
-                    downloaded_files=[],
-                )
                 video_results.append(video_result)
+                self._report_progress(i, total_videos, video_result)
 
-        self.logger.success(
-            f"Playlist processing complete: {successful_downloads} successful, {failed_downloads} failed"
-        )
-
-        return PlaylistResult(
+        playlist_result = PlaylistResult(
             playlist_details=playlist,
             video_results=video_results,
             total_requested=total_videos,
-            processing_time_seconds=0.0,  # Will be set by caller
         )
+        successful_downloads, partial_downloads, failed_downloads = playlist_result.status_counts
+        self.logger.success(
+            f"Playlist processing complete: {successful_downloads} successful, "
+            f"{partial_downloads + failed_downloads} failed"
+        )
+
+        return playlist_result
+
+    def _dedupe_video_urls(self, video_urls: list[str]) -> list[str]:
+        """Drop playlist entries that point at an already listed video.
+
+        Entries are compared by video ID (falling back to the URL itself when no ID
+        can be extracted), so the same video is never handed to yt-dlp twice.
+
+        Args:
+            video_urls: Video URLs in playlist order
+
+        Returns:
+            Video URLs in playlist order with duplicates removed
+        """
+        seen: set[str] = set()
+        unique_urls = []
+        for video_url in video_urls:
+            key = extract_video_id_from_url(video_url) or video_url
+            if key not in seen:
+                seen.add(key)
+                unique_urls.append(video_url)
+
+        duplicate_count = len(video_urls) - len(unique_urls)
+        if duplicate_count:
+            self.logger.warning(f"Skipping {duplicate_count} duplicate videos in playlist")
+        return unique_urls
+
+    def _download_videos_concurrently(
+        self,
+        video_urls: list[str],
+        subtitle_languages: list[str],
+        file_index: dict[str, list[Path]] | None = None,
+    ) -> list[VideoResult]:
+        """Download playlist videos on a thread pool, returning results in playlist order.
+
+        Videos are independent and network-bound, so up to `concurrency` of them run at
+        once. The shutdown callback is polled while they run; once it fires, videos that
+        have not started yet are cancelled (or skipped by the worker that picks them up)
+        and only downloads that were already running are kept.
+
+        Args:
+            video_urls: URLs of the videos to download
+            subtitle_languages: List of language codes to download
+            file_index: Output directory files grouped by video ID
+
+        Returns:
+            VideoResult for every video that was processed, in playlist order
+        """
+        total_videos = len(video_urls)
+        results_by_index: dict[int, VideoResult] = {}
+        shutdown_logged = False
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.concurrency, total_videos),
+            thread_name_prefix="video-kb-download",
+        )
+        try:
+            futures: dict[Future[VideoResult | None], int] = {
+                executor.submit(
+                    self._download_playlist_video,
+                    i,
+                    total_videos,
+                    video_url,
+                    subtitle_languages,
+                    file_index,
+                ): i
+                for i, video_url in enumerate(video_urls, 1)
+            }
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(
+                    pending, timeout=WORKER_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    video_result = future.result()
+                    if video_result is None:
+                        continue
+                    results_by_index[futures[future]] = video_result
+                    self._report_progress(len(results_by_index), total_videos, video_result)
+
+                if not shutdown_logged and self._is_shutdown_requested():
+                    shutdown_logged = True
+                    cancelled = sum(future.cancel() for future in pending)
+                    self.logger.warning(
+                        f"Shutdown requested. Cancelled {cancelled}/{total_videos} videos "
+                        "that had not started yet."
+                    )
+        except BaseException:
+            # Don't wait for busy workers when interrupted (e.g. a forced exit)
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return [results_by_index[i] for i in sorted(results_by_index)]
+
+    def _download_playlist_video(
+        self,
+        index: int,
+        total_videos: int,
+        video_url: str,
+        subtitle_languages: list[str],
+        file_index: dict[str, list[Path]] | None = None,
+    ) -> VideoResult | None:
+        """Download one playlist video, turning unexpected errors into a failed result.
+
+        Shutdown is checked first, so a video that has not started when it is requested
+        is skipped rather than reported as a failed download.
+
+        Args:
+            index: 1-based position of the video in the playlist
+            total_videos: Number of videos being processed
+            video_url: YouTube video URL
+            subtitle_languages: List of language codes to download
+            file_index: Output directory files grouped by video ID
+
+        Returns:
+            VideoResult for the video (failed if an unexpected error was raised),
+            or None if shutdown was requested before it started
+        """
+        if self._is_shutdown_requested():
+            return None
+
+        self.logger.info(f"Processing video {index}/{total_videos}: {video_url}")
+
+        try:
+            return self._download_video_transcripts(
+                video_url, subtitle_languages, file_index=file_index
+            )
+        except Exception as error:
+            error_message = f"Unexpected error processing video {index}: {error}"
+            self.logger.error(error_message)
+            return VideoResult(
+                video_id=None,
+                title=None,
+                url=video_url,
+                warnings=[],
+                errors=[error_message],
+                downloaded_files=[],
+            )
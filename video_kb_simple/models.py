@@ -77,20 +77,33 @@ class PlaylistResult(BaseModel):
     total_requested: int = 0
     processing_time_seconds: float = 0.0
 
+    @property
+    def status_counts(self) -> tuple[int, int, int]:
+        """Counts of (fully successful, partially successful, failed) videos in one pass."""
+        success = partial_success = fail = 0
+        for vr in self.video_results:
+            if vr.is_fail:
+                fail += 1
+            elif vr.is_partial_success:
+                partial_success += 1
+            else:
+                success += 1
+        return success, partial_success, fail
+
     @property
     def success_downloads(self) -> int:
         """Count of videos that were fully successful (no warnings or errors)."""
-        return sum(1 for vr in self.video_results if vr.is_full_success)
+        return self.status_counts[0]
 
     @property
     def partial_success_downloads(self) -> int:
         """Count of videos that were partially successful (warnings but no errors)."""
-        return sum(1 for vr in self.video_results if vr.is_partial_success)
+        return self.status_counts[1]
 
     @property
     def fail_downloads(self) -> int:
         """Count of videos that failed to download (have errors)."""
-        return sum(1 for vr in self.video_results if vr.is_fail)
+        return self.status_counts[2]
 
     @property
     def errors(self) -> list[str]:
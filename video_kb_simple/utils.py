@@ -1,16 +1,20 @@
 """Utility functions and constants for video-kb-simple."""
 
 import re
+from collections.abc import Hashable, Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+T = TypeVar("T", bound=Hashable)
 
 # ==================== URL PATTERNS AND CONSTANTS ====================
-YOUTUBE_VIDEO_URL_PATTERNS = [
-    r"https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})",
-    r"https?://(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})",
-]
+# Compiled once at import; the video pattern runs for every playlist entry
+YOUTUBE_VIDEO_URL_PATTERN = re.compile(
+    r"https?://(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})"
+)
 
-YOUTUBE_CHANNEL_URL_PATTERN = r"https?://(?:www\.)?youtube\.com/@[\w-]+/?$"
+YOUTUBE_VIDEO_ID_LENGTH = 11
+YOUTUBE_CHANNEL_URL_PATTERN = re.compile(r"https?://(?:www\.)?youtube\.com/@[\w-]+/?$")
 
 DEFAULT_SUBTITLE_LANGUAGES = ["en"]
 SUBTITLE_EXTENSIONS = {".vtt", ".srt", ".ass"}
@@ -19,6 +23,21 @@ FILE_TYPE_SUBTITLE = "subtitle"
 FILE_TYPE_METADATA = "metadata"
 FILE_TYPE_UNKNOWN = "unknown"
 
+# ==================== DOWNLOAD AND CACHE DEFAULTS ====================
+# Kept here rather than in downloader/cache so the CLI can build its options
+# without importing yt-dlp or pydantic
+MAX_CONCURRENCY = 8  # Upper bound on parallel video downloads (YouTube rate limits)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "video-kb-simple"
+DEFAULT_CACHE_TTL = 3600  # Seconds before cached playlist details are re-extracted
+
+
+def unique_preserve(items: Iterable[T]) -> list[T]:
+    """Return items without duplicates, keeping the first occurrence of each in order."""
+    seen: set[T] = set()
+    add = seen.add
+    # set.add returns None, so `x in seen or add(x)` records x and is falsy only when x is new
+    return [item for item in items if not (item in seen or add(item))]
+
 
 def normalize_languages(subtitle_languages: list[str] | None) -> list[str]:
     """Normalize language list, providing defaults if None."""
@@ -41,11 +60,8 @@ def detect_file_type_and_language(file_path: Path) -> tuple[str, str | None]:
 
 def extract_video_id_from_url(url: str) -> str | None:
     """Extract video ID from YouTube URL without API call."""
-    for pattern in YOUTUBE_VIDEO_URL_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = YOUTUBE_VIDEO_URL_PATTERN.search(url)
+    return match.group(1) if match else None
 
 
 def normalize_playlist_url(url: str) -> tuple[str, Any]:
@@ -55,7 +71,7 @@ def normalize_playlist_url(url: str) -> tuple[str, Any]:
     normalized_url = url
     playlist_type = None
 
-    if re.match(YOUTUBE_CHANNEL_URL_PATTERN, url):
+    if YOUTUBE_CHANNEL_URL_PATTERN.match(url):
         normalized_url = url.rstrip("/") + "/videos"
         playlist_type = PlaylistType.CHANNEL_VIDEOS
     else:
@@ -67,10 +83,8 @@ def normalize_playlist_url(url: str) -> tuple[str, Any]:
             playlist_type = PlaylistType.CHANNEL_LIVE
         elif "playlist?list=" in url:
             playlist_type = PlaylistType.PLAYLIST
-        else:
-            for pattern in YOUTUBE_VIDEO_URL_PATTERNS:
-                if re.search(pattern, url):
-                    playlist_type = PlaylistType.SINGLE_VIDEO
+        elif YOUTUBE_VIDEO_URL_PATTERN.search(url):
+            playlist_type = PlaylistType.SINGLE_VIDEO
 
     if playlist_type is None:
         from .models import URLNormalizationError
@@ -1,7 +1,8 @@
 """yt-dlp operations handler for video-kb-simple."""
 
 import logging
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +12,7 @@ from slugify import slugify
 
 from .logger import Logger, YTDLPLogger
 from .models import DownloadedFile, PlaylistDetails, PlaylistType, VideoResult
-from .utils import detect_file_type_and_language
+from .utils import YOUTUBE_VIDEO_ID_LENGTH, detect_file_type_and_language
 
 
 class YTDLPHandler:
@@ -40,6 +41,7 @@ class YTDLPHandler:
         log_level: int = logging.INFO,
         browser_for_cookies: str | None = None,
         shutdown_check: Callable[[], bool] | None = None,
+        cache_dir: Path | None = None,
     ):
         """Initialize the yt-dlp handler.
 
@@ -48,17 +50,18 @@ class YTDLPHandler:
             log_level: Logging level
             browser_for_cookies: Browser to extract cookies from
             shutdown_check: Optional callback to check if shutdown was requested
+            cache_dir: Directory whose "yt-dlp" subdirectory holds yt-dlp's cache
+                (player JS, signatures); None keeps yt-dlp's default location
         """
         self.output_dir = output_dir
         self.log_level = log_level
         self.browser_for_cookies = browser_for_cookies
         self.slug_max_length = self.DEFAULT_SLUG_MAX_LENGTH
         self.shutdown_check: Callable[[], bool] | None = shutdown_check
+        self.cache_dir = cache_dir
 
         console = Console()
         self.logger = Logger(console, log_level)
-        # Create a single YTDLPLogger instance that can be reused
-        self.ytdlp_logger = YTDLPLogger(self.logger, log_level)
 
     def _is_shutdown_requested(self) -> bool:
         """Check if shutdown has been requested."""
@@ -97,6 +100,9 @@ class YTDLPHandler:
         if self.browser_for_cookies:
             base_options["cookiesfrombrowser"] = (self.browser_for_cookies,)
 
+        if self.cache_dir is not None:
+            base_options["cachedir"] = str(self.cache_dir / "yt-dlp")
+
         # Override with any provided options
         base_options.update(kwargs)
 
@@ -112,14 +118,16 @@ class YTDLPHandler:
         return base_options
 
     def _prepare_ytdlp_options(self, prefix: str, **kwargs: Any) -> dict[str, Any]:
-        """Prepare yt-dlp options with logger setup for the given prefix."""
-        # Configure the shared logger
-        self.ytdlp_logger.set_prefix(prefix)
-        self.ytdlp_logger.clear_captured_logs()
+        """Prepare yt-dlp options with logger setup for the given prefix.
+
+        Each call gets its own YTDLPLogger (under the "logger" key) so concurrent
+        downloads never mix up each other's captured warnings and errors.
+        """
+        ytdlp_logger = YTDLPLogger(self.logger, self.log_level, prefix)
 
         # Create options with logger and warning capture enabled
         return self._create_ytdlp_options(
-            logger=self.ytdlp_logger,
+            logger=ytdlp_logger,
             no_warnings=False,  # Enable warnings so they can be captured
             **kwargs,
         )
@@ -196,7 +204,7 @@ class YTDLPHandler:
         video_id: str | None = None,
     ) -> dict[str, Any]:
         """Create yt-dlp options for downloading transcripts with custom logger."""
-        # Use the shared YTDLPLogger instance with video_id as prefix
+        # Capture yt-dlp messages with video_id as prefix
         prefix = video_id if video_id is not None else "VIDEO"
 
         return self._prepare_ytdlp_options(
@@ -212,8 +220,19 @@ class YTDLPHandler:
             outtmpl=self._get_output_templates(),
         )
 
-    def _scan_downloaded_files(self, video_id: str) -> list[DownloadedFile]:
-        """Scan for files matching video_id with optimized globbing."""
+    def _scan_downloaded_files(
+        self, video_id: str, file_index: Mapping[str, list[Path]] | None = None
+    ) -> list[DownloadedFile]:
+        """Scan for files matching video_id with optimized globbing.
+
+        Args:
+            video_id: YouTube video ID
+            file_index: Index from _index_downloaded_files; when given, the video's files
+                are looked up in it instead of globbing the output directory
+        """
+        if file_index is not None:
+            return [self._create_downloaded_file(f) for f in file_index.get(video_id, ())]
+
         if not self.output_dir.exists():
             return []
 
@@ -223,6 +242,24 @@ class YTDLPHandler:
 
         return [self._create_downloaded_file(f) for f in files if f.is_file()]
 
+    def _index_downloaded_files(self) -> dict[str, list[Path]]:
+        """Group the files in the output directory by the video ID in their name.
+
+        Relies on the "<date>_<video_id>..." naming from _get_output_templates, so one
+        os.scandir pass replaces a glob per video when checking a playlist for
+        existing downloads.
+        """
+        file_index: dict[str, list[Path]] = {}
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if "_" in entry.name and entry.is_file():
+                        video_id = entry.name.split("_", 1)[1][:YOUTUBE_VIDEO_ID_LENGTH]
+                        file_index.setdefault(video_id, []).append(Path(entry.path))
+        except OSError:
+            return {}
+        return file_index
+
     def _create_downloaded_file(self, file_path: Path) -> DownloadedFile:
         """Create DownloadedFile object from path."""
         file_type, language = detect_file_type_and_language(file_path)
@@ -307,6 +344,7 @@ class YTDLPHandler:
         download_options = self._create_download_options(
             download_metadata, download_subtitles, subtitle_languages, video_id
         )
+        ytdlp_logger: YTDLPLogger = download_options["logger"]
 
         try:
             # Check for shutdown signal before starting yt-dlp download
@@ -321,7 +359,7 @@ class YTDLPHandler:
                 video_info = youtube_downloader.extract_info(video_url, download=True)
 
             if not video_info:
-                warnings, errors = self.ytdlp_logger.get_warnings_and_errors_separate()
+                warnings, errors = ytdlp_logger.get_warnings_and_errors_separate()
                 return self._create_failed_result(
                     video_url=video_url,
                     error_message="Could not extract video information",
@@ -342,7 +380,7 @@ class YTDLPHandler:
 
             self.logger.success(f"Successfully downloaded transcripts for: {title}")
 
-            warnings, errors = self.ytdlp_logger.get_warnings_and_errors_separate()
+            warnings, errors = ytdlp_logger.get_warnings_and_errors_separate()
 
             return self._create_success_result(
                 video_id=actual_video_id,
@@ -357,7 +395,7 @@ class YTDLPHandler:
         except (yt_dlp.utils.DownloadError, yt_dlp.utils.ExtractorError) as error:
             error_message = f"Failed to download transcripts: {error!s}"
             self.logger.error(error_message)
-            warnings, errors = self.ytdlp_logger.get_warnings_and_errors_separate()
+            warnings, errors = ytdlp_logger.get_warnings_and_errors_separate()
             return self._create_failed_result(
                 video_url=video_url,
                 error_message=error_message,
@@ -369,7 +407,7 @@ class YTDLPHandler:
             # Catch any other unexpected errors
             error_message = f"Unexpected error during download: {error!s}"
             self.logger.error(error_message)
-            warnings, errors = self.ytdlp_logger.get_warnings_and_errors_separate()
+            warnings, errors = ytdlp_logger.get_warnings_and_errors_separate()
             return self._create_failed_result(
                 video_url=video_url,
                 error_message=error_message,